@@ -0,0 +1,73 @@
+"""Measures signature binding for containers with many annotated parameters.
+
+    python examples/benchmarks/binding.py
+
+Compares binding the parameters of `N_FUNCS` functions with the cached
+`injectable_kind()` classifier against the uncached classification.
+Classification is a small part of binding so expect a modest speedup
+(~1.1-1.25x on a noisy machine).
+"""
+import typing as t
+from time import perf_counter
+
+import uzi
+from uzi import markers
+from uzi._common import typed_signature
+from uzi._functools import BoundParams
+
+
+N_FUNCS = 2000
+N_PARAMS = 8
+ROUNDS = 5
+
+
+def make_funcs(n: int):
+    classes = [type(f"Service{i}", (), {}) for i in range(n)]
+    T = t.TypeVar("T")
+    annotations = [
+        lambda i: classes[i],
+        lambda i: t.Optional[classes[i]],
+        lambda i: t.Annotated[classes[i], "meta"],
+        lambda i: t.Annotated[classes[i], markers.Dep(classes[i - 1])],
+        lambda i: int,
+        lambda i: str,
+        lambda i: T,
+        lambda i: markers.Dep(classes[i // 2]),
+    ]
+    container = uzi.Container().provide(*classes)
+    funcs = []
+    for i in range(n):
+        ns = {f"A{x}": annotations[x % len(annotations)](i) for x in range(N_PARAMS)}
+        args = ", ".join(f"a{x}: A{x}" for x in range(N_PARAMS))
+        exec(f"def func{i}({args}): pass", ns)
+        funcs.append(ns[f"func{i}"])
+    return container, funcs
+
+
+def bench(container, signatures):
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = perf_counter()
+        for sig in signatures:
+            BoundParams.bind(sig, None, container)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    container, funcs = make_funcs(N_FUNCS)
+    signatures = [typed_signature(f) for f in funcs]
+
+    cached = bench(container, signatures)
+
+    injectable_kind = markers.injectable_kind
+    markers.injectable_kind = markers._eval_injectable_kind
+    try:
+        uncached = bench(container, signatures)
+    finally:
+        markers.injectable_kind = injectable_kind
+
+    total = N_FUNCS * N_PARAMS
+    print(f"  uncached: {uncached * 1e9 / total:,.0f} ns/param")
+    print(f"    cached: {cached * 1e9 / total:,.0f} ns/param")
+    print(f"   speedup: {uncached / cached:.2f}x")
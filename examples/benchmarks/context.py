@@ -0,0 +1,37 @@
+"""Measures the per-call overhead of getting the current injector of a
+`ContextLocalScope`.
+
+    python examples/benchmarks/context.py
+
+Compares `scope.injector()`, which looks up the current context's injector on
+every call, with the handle returned by `scope.bind_context()`, which caches it.
+"""
+from timeit import repeat
+
+import uzi
+from uzi.scopes import ContextLocalScope
+
+
+N = 500_000
+
+
+class Service:
+    pass
+
+
+if __name__ == "__main__":
+    container = uzi.Container()
+    container.factory(Service)
+    scope = ContextLocalScope(container)
+
+    with scope.bind_context() as handle:
+        node = scope.graph[Service]
+        cases = {
+            "scope.injector()": lambda: scope.injector()[node],
+            "handle.injector": lambda: handle.injector[node],
+            "scope.injector().make()": lambda: scope.injector().make(Service),
+            "handle.make()": lambda: handle.make(Service),
+        }
+        for name, fn in cases.items():
+            best = min(repeat(fn, number=N, repeat=5))
+            print(f"{name:>24}: {best * 1e9 / N:,.0f} ns/call")
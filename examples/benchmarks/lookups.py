@@ -0,0 +1,42 @@
+"""Measures the cost of evaluating `Lookup` expression chains.
+
+    python examples/benchmarks/lookups.py
+
+Compares hand-written access, the compiled getter pipeline used by
+`Lookup.__eval__()` and the step by step evaluation of each expression.
+"""
+from timeit import repeat
+
+from uzi._common.lookups import Lookup
+
+
+N = 200_000
+
+
+class Request:
+    def __init__(self) -> None:
+        self.headers = {"x-tenant": "acme"}
+        self.user = type("User", (), {"profile": type("Profile", (), {"name": "x"})})
+
+
+def handwritten(req: Request):
+    return req.headers["x-tenant"], req.user.profile.name
+
+
+tenant, name = Lookup().headers["x-tenant"], Lookup().user.profile.name
+
+
+def compiled(req: Request):
+    return tenant.__eval__(req), name.__eval__(req)
+
+
+def stepwise(req: Request):
+    return tenant.__eval__(req, start=0), name.__eval__(req, start=0)
+
+
+if __name__ == "__main__":
+    req = Request()
+    assert handwritten(req) == compiled(req) == stepwise(req)
+    for fn in (handwritten, compiled, stepwise):
+        best = min(repeat(lambda: fn(req), number=N, repeat=5))
+        print(f"{fn.__name__:>12}: {best * 1e9 / N:,.0f} ns/call")
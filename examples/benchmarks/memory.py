@@ -0,0 +1,85 @@
+"""Measures the memory used per graph node in multi-tenant setups.
+
+    python examples/benchmarks/memory.py
+
+Two layouts are measured:
+
+- `local`: every tenant graph resolves all providers and their dependencies
+    locally.
+- `shared`: tenant providers only depend on services from a shared parent
+    graph so their `BoundParams` can be shared between the tenant graphs.
+"""
+import gc
+import tracemalloc
+import typing as t
+
+import uzi
+from uzi.scopes import Scope
+
+
+N_PROVIDERS = 1000
+N_TENANTS = 20
+
+TARGET_BYTES_PER_NODE = {
+    "local": 1200,
+    "shared": 900,
+}
+
+
+def make_classes(n: int, prefix: str, deps: t.Callable[[int], tuple] = None):
+    classes = []
+    for i in range(n):
+        ns = {}
+        deps_ = deps or (lambda i: classes and (classes[i - 1], classes[i // 2]))
+        if args := deps_(i):
+            exec(
+                "def __init__(self, a: A, b: B, /, *, c: C = None): pass",
+                {"A": args[0], "B": args[1], "C": args[-1]},
+                ns,
+            )
+        else:
+            ns["__init__"] = lambda self: None
+        classes.append(type(f"{prefix}{i}", (), ns))
+    return classes
+
+
+def measure(layout: str):
+    services = make_classes(N_PROVIDERS, "Service")
+    if layout == "local":
+        classes = services
+        root = uzi.Container("root")
+    else:
+        classes = make_classes(
+            N_PROVIDERS, "Handler", lambda i: (services[i], services[i // 2])
+        )
+        root = uzi.Container("root").provide(*services)
+
+    base = uzi.Container("base").provide(*classes)
+    root_scope = Scope(root)
+    for cls in services:
+        root_scope.graph[cls]
+
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+
+    scopes = []
+    for _ in range(N_TENANTS):
+        scope = Scope(uzi.Container("tenant").extend(base), root_scope)
+        for cls in classes:
+            scope.graph[cls]
+        scopes.append(scope)
+
+    gc.collect()
+    end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(s.size_diff for s in end.compare_to(start, "filename"))
+    return size / (N_PROVIDERS * N_TENANTS)
+
+
+if __name__ == "__main__":
+    for layout, target in TARGET_BYTES_PER_NODE.items():
+        per_node = measure(layout)
+        status = "OK" if per_node <= target else "OVER TARGET"
+        print(f"{layout:>8}: {per_node:,.1f} bytes/node (target {target:,}) {status}")
@@ -0,0 +1,49 @@
+"""Compares creating many instances of a transient dependency in a loop with
+`injector.make()` vs. a `ProviderOf` injected callable.
+
+    PYTHONPATH=. python examples/benchmarks/provider_of.py
+"""
+from timeit import repeat
+
+import uzi
+from uzi.markers import ProviderOf
+from uzi.scopes import Scope
+
+
+N = 10_000
+ITEMS = range(100)
+
+
+class Processor:
+    def process(self, item):
+        return item
+
+
+class MakeWorker:
+    def __init__(self, injector: uzi.Injector) -> None:
+        self.injector = injector
+
+    def run(self):
+        make = self.injector.make
+        return [make(Processor).process(item) for item in ITEMS]
+
+
+class ProviderOfWorker:
+    def __init__(self, make: ProviderOf[Processor]) -> None:
+        self.make = make
+
+    def run(self):
+        make = self.make
+        return [make().process(item) for item in ITEMS]
+
+
+if __name__ == "__main__":
+    container = uzi.Container()
+    container.factory(Processor)
+    container.factory(ProviderOfWorker)
+    injector = Scope(container).injector()
+
+    for worker in (MakeWorker(injector), injector.make(ProviderOfWorker)):
+        best = min(repeat(worker.run, number=N, repeat=5))
+        name = worker.__class__.__name__
+        print(f"{name:>18}: {best * 1e9 / N / len(ITEMS):,.0f} ns/item")
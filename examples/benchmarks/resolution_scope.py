@@ -0,0 +1,44 @@
+"""Compares resolving `Service` with `Foo` provided as a `Factory` vs. as a
+`ResolutionScoped` provider.
+
+    PYTHONPATH=. python examples/benchmarks/resolution_scope.py
+
+`Service` (see `_bench.py`) requires `Foo` 8 times across its object graph. As
+a `Factory`, a new `Foo` is created for each. As `ResolutionScoped`, a single
+`Foo` is created per call and shared.
+"""
+from timeit import repeat
+
+import uzi
+from uzi.scopes import Scope
+
+from examples.benchmarks._bench import Bar, Baz, Foo, FooBar, FooBarBaz, Service
+
+
+N = 100_000
+
+
+class CountingFoo(Foo):
+    created = 0
+
+    def __init__(self) -> None:
+        CountingFoo.created += 1
+
+
+if __name__ == "__main__":
+    for name in ("factory", "resolution_scoped"):
+        container = uzi.Container()
+        getattr(container, name)(Foo, CountingFoo)
+        for cls in (Bar, Baz, FooBar, FooBarBaz, Service):
+            container.factory(cls)
+
+        make = Scope(container).injector().bound(Service)
+        CountingFoo.created = 0
+        make()
+        created, CountingFoo.created = CountingFoo.created, 0
+
+        best = min(repeat(make, number=N, repeat=5))
+        print(
+            f"{name:>18}: {best * 1e9 / N:,.0f} ns/call "
+            f"({created} Foo instance(s) per call)"
+        )
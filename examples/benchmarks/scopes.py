@@ -0,0 +1,69 @@
+"""Measures `ThreadSafeScope` push/pop contention.
+
+    python examples/benchmarks/scopes.py
+
+64 threads share one scope. Each repeatedly gets the current injector
+(pushing one if none is running) and pops it. `ThreadSafeScope` publishes
+injectors without a lock and is compared with `LockedScope`, which guards
+every transition with a single lock.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Lock
+from time import perf_counter
+
+import uzi
+from uzi.exceptions import InvalidStateError
+from uzi.scopes import Scope, ThreadSafeScope
+
+
+N = 5_000
+THREADS = 64
+
+
+class LockedScope(Scope):
+    """A scope that serializes push and pop behind one lock."""
+
+    __slots__ = ("lock",)
+
+    def __init_attrs__(self, kwds: dict):
+        kwds["lock"] = Lock()
+        return super().__init_attrs__(kwds)
+
+    def injector(self, *, push=True):
+        if inj := self.current:
+            return inj
+        with self.lock:
+            return self._push()
+
+    def pop(self):
+        with self.lock:
+            if self.active:
+                return self._pop()
+        raise InvalidStateError(f"injector not running: {self}")
+
+
+def run(cls: type[Scope]):
+    scope = cls(uzi.Container())
+    barrier = Barrier(THREADS + 1)
+
+    def work():
+        barrier.wait()
+        for _ in range(N):
+            scope.injector()
+            try:
+                scope.pop()
+            except InvalidStateError:
+                pass
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        futs = [pool.submit(work) for _ in range(THREADS)]
+        barrier.wait()
+        start = perf_counter()
+        for fut in futs:
+            fut.result()
+        return THREADS * N / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    for cls in (LockedScope, ThreadSafeScope):
+        print(f"{cls.__name__:>16}: {run(cls):>12,.0f} transitions/s")
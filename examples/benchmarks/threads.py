@@ -0,0 +1,69 @@
+"""Measures resolution throughput vs. the number of threads.
+
+    python examples/benchmarks/threads.py
+
+Each thread repeatedly creates a factory dependency that depends on a shared
+singleton using a single `ThreadSafeScope`. On free-threaded builds of CPython
+(e.g. `python3.13t`) throughput should scale with the number of cores, while on
+builds with a GIL it stays flat.
+"""
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import perf_counter
+
+import uzi
+from uzi.scopes import ThreadSafeScope
+
+
+N = 50_000
+THREADS = sorted({1, 2, 4, 8, os.cpu_count() or 1})
+
+
+class Config:
+    pass
+
+
+class Service:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+
+class Handler:
+    def __init__(self, service: Service, config: Config) -> None:
+        self.service = service
+
+
+def run(scope: ThreadSafeScope, n_threads: int):
+    barrier = Barrier(n_threads + 1)
+
+    def work():
+        barrier.wait()
+        make = scope.injector().bound(Handler)
+        for _ in range(N):
+            make()
+
+    with ThreadPoolExecutor(n_threads) as pool:
+        futs = [pool.submit(work) for _ in range(n_threads)]
+        barrier.wait()
+        start = perf_counter()
+        for fut in futs:
+            fut.result()
+        return n_threads * N / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    container = uzi.Container()
+    container.singleton(Config)
+    container.factory(Service)
+    container.factory(Handler)
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]} (GIL {'enabled' if gil else 'disabled'})")
+
+    base = None
+    for n_threads in THREADS:
+        with (scope := ThreadSafeScope(container)):
+            ops = run(scope, n_threads)
+        base = base or ops
+        print(f"{n_threads:>4} threads: {ops:>12,.0f} ops/s ({ops / base:.2f}x)")
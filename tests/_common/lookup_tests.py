@@ -109,3 +109,28 @@ class LookupTests:
             a = dict(list=list(range(10)), data=dict(bee="Im a bee"))
 
         new().a["list"]().__eval__(Foo)
+
+    def test_compile(self, new):
+        class Foo:
+            a = dict(list=list(range(10)), data=dict(bee="Im a bee"))
+
+            class bar:
+                baz = "baz"
+
+                @classmethod
+                def run(cls, *args, **kwargs) -> None:
+                    return Foo
+
+        p = new().bar.run(1, k=2).bar.baz
+        funcs = p.__compile__()
+        assert len(funcs) == 3
+        assert p.__eval__(Foo) == "baz"
+        assert len(p._v_eval) == 3
+
+        p = new().a["data"]["bee"]
+        assert len(p.__compile__()) == 3
+        assert p.__eval__(Foo) == "Im a bee"
+        assert p.__eval__(Foo.a, start=1) == p.__eval__(Foo)
+
+        p = new().a["list"][2:-2]
+        assert p.__eval__(Foo) == Foo.a["list"][2:-2]
@@ -184,6 +184,64 @@ class ContainerTest(BaseTestCase[_T_Ioc]):
         assert sub[pro2] is pro2
         assert sub[pro3] is None
 
+    def test_auto_bind(self, new: _T_FnNew):
+        from abc import ABC
+        from uzi.providers import Alias
+        from uzi.scopes import Scope
+
+        class Repo(ABC):
+            pass
+
+        class SqlRepo(Repo):
+            pass
+
+        class MemoryRepo(Repo):
+            pass
+
+        assert not new().auto_bind
+        sub = new(auto_bind=True)
+        assert sub.auto_bind
+        assert sub[Repo] is None
+
+        sub.factory(SqlRepo)
+        assert isinstance(sub[Repo], Alias)
+        assert sub[Repo].concrete is SqlRepo
+        assert sub[Repo].container is sub
+        assert sub[Repo] is sub[Repo]
+        assert sub[ABC] is sub[object] is None
+        assert isinstance(Scope(sub).injector().make(Repo), SqlRepo)
+
+        sub.factory(MemoryRepo)
+        assert sub[Repo] is None
+
+        other = new()
+        other.factory(SqlRepo)
+        assert other[Repo] is None
+
+    def test_concurrent_setitem(self, new: _T_FnNew):
+        from concurrent.futures import ThreadPoolExecutor
+        from threading import Barrier
+
+        class Repo:
+            pass
+
+        n = 8
+        classes = [type(f"Repo{i}", (Repo,), {}) for i in range(n * 50)]
+        sub = new(auto_bind=True)
+        barrier = Barrier(n)
+
+        def register(i):
+            barrier.wait()
+            for cls in classes[i::n]:
+                sub.factory(cls)
+                sub[Repo]
+
+        with ThreadPoolExecutor(n) as pool:
+            list(pool.map(register, range(n)))
+
+        assert all(sub.providers[cls].concrete is cls for cls in classes)
+        assert sub[Repo] is None
+
     def test__resolve(
         self,
         new: _T_FnNew,
@@ -80,3 +80,67 @@ class InjectorTests(BaseTestCase[Injector]):
             sub[key]
         else:
             sub.make(key)
+
+    def test_get(self):
+        from uzi.containers import Container
+        from uzi.scopes import Scope
+
+        class Foo:
+            pass
+
+        injector = Scope(Container().provide(Foo)).injector()
+        assert isinstance(injector.get(Foo)(), Foo)
+        assert injector.get(_T_Miss) is None
+        assert injector.get(_T_Miss, 123) == 123
+        assert _null_injector.get(_T_Miss, 123) == 123
+
+    async def test_result(self):
+        from uzi.containers import Container
+        from uzi.exceptions import InvalidStateError
+        from uzi.markers import Resolved
+        from uzi.scopes import Scope
+
+        class Foo:
+            pass
+
+        class Bar:
+            def __init__(self, foo: Resolved(Foo)) -> None:
+                self.foo = foo
+
+        async def make_foo():
+            return Foo()
+
+        container = Container().provide(Bar)
+        container.singleton(Foo, make_foo)
+        injector = Scope(container).injector()
+
+        assert not injector.graph[Bar].is_async
+        with pytest.raises(InvalidStateError):
+            injector.result(Foo)
+        with pytest.raises(InvalidStateError):
+            injector.make(Bar)
+
+        (foo,) = await injector.awarmup(Foo)
+        assert injector.result(Foo) is foo
+        assert injector.make(Bar).foo is foo
+        assert isinstance(injector.result(Bar), Bar)
+
+    def test_result_async_factory(self):
+        from uzi.containers import Container
+        from uzi.scopes import Scope
+
+        class Foo:
+            pass
+
+        calls = []
+
+        async def make_foo():
+            calls.append(None)  # pragma: no cover
+            return Foo()  # pragma: no cover
+
+        container = Container()
+        container.factory(Foo, make_foo)
+        injector = Scope(container).injector()
+        with pytest.raises(TypeError):
+            injector.result(Foo)
+        assert not calls
@@ -84,7 +84,7 @@ class Service:
         foobar: FooBar,
         foobarbaz: FooBarBaz,
         bar_or_baz: t.Union[Bar, Baz],
-        baz_bar: t.Annotated[Bar, Dep(FooBarBaz).lookup.deps[1::-1][0].bar],
+        baz_bar: t.Annotated[Bar, Dep(FooBarBaz).lookup.deps[::-1][0].bar],
     ) -> None:
         self.deps = foo, bar, baz, foobar, foobarbaz, bar_or_baz, baz_bar
         assert isinstance(a, int)
@@ -0,0 +1,139 @@
+import gc
+import typing as t
+import pytest
+
+
+from collections import abc
+
+
+from uzi.containers import Container
+from uzi.graph.core import Graph, GraphCache, GraphCacheInfo, _null_graph
+
+
+xfail = pytest.mark.xfail
+parametrize = pytest.mark.parametrize
+
+
+_T_FnNew = abc.Callable[..., GraphCache]
+
+
+@pytest.fixture
+def cls():
+    return GraphCache
+
+
+def test_basic(new: _T_FnNew):
+    sub = new()
+    assert isinstance(sub, GraphCache)
+    assert isinstance(sub, abc.Mapping)
+    assert sub.info() == GraphCacheInfo(0, 0, 0, 128, 0)
+
+
+@xfail(raises=ValueError, strict=True)
+def test_invalid_maxsize(new: _T_FnNew):
+    new(-1)
+
+
+def test_hits_and_misses(new: _T_FnNew):
+    sub = new()
+    parent = Graph(Container())
+    graph = Graph(Container(), parent)
+    assert sub.get(parent) is None
+    assert sub.setdefault(parent, graph) is graph
+    assert sub.setdefault(parent, Graph(Container(), parent)) is graph
+    assert sub[parent] is graph
+    assert parent in sub and len(sub) == 1
+    assert sub.info() == GraphCacheInfo(1, 1, 0, 128, 1)
+
+
+def test_lru_eviction(new: _T_FnNew):
+    sub = new(2)
+    parents = [Graph(Container()) for _ in range(3)]
+    for p in parents:
+        sub.setdefault(p, Graph(Container(), p))
+
+    gc.collect()
+    assert list(sub) == parents[1:]
+    assert sub.info().evictions == 1
+
+    sub[parents[1]]
+    sub.setdefault(parents[0], Graph(Container(), parents[0]))
+    gc.collect()
+    assert set(sub) == {parents[0], parents[1]}
+    assert sub.info().evictions == 2
+
+
+def test_weak_refs(new: _T_FnNew):
+    sub = new(0)
+    parent = Graph(Container())
+    graph = sub.setdefault(parent, Graph(Container(), parent))
+    assert sub[parent] is graph
+    del graph
+    gc.collect()
+    assert parent not in sub
+    assert len(sub) == 0
+
+
+def test_unbounded(new: _T_FnNew):
+    sub = new(None)
+    parents = [Graph(Container()) for _ in range(200)]
+    for p in parents:
+        sub.setdefault(p, Graph(Container(), p))
+    gc.collect()
+    assert len(sub) == 200
+    assert sub.info().evictions == 0
+
+
+def test_container_get_graph():
+    container = Container()
+    graph = container.get_graph(_null_graph)
+    assert container.get_graph(_null_graph) is graph
+    assert container.g.info().hits == 1
+
+
+def test_released_with_scope():
+    from weakref import ref
+
+    from uzi.scopes import Scope
+
+    class Foo:
+        pass
+
+    class Bar:
+        def __init__(self, foo: Foo) -> None:
+            self.foo = foo
+
+    root = Scope(Container().provide(Foo))
+    scope = Scope(Container().provide(Bar), root)
+    assert isinstance(scope.injector().make(Bar).foo, Foo)
+    graph, root_graph = ref(scope.graph), ref(root.graph)
+    scope.pop()
+    del scope
+    gc.collect()
+    assert graph() is None
+
+    root.pop()
+    del root
+    gc.collect()
+    assert root_graph() is None
+
+
+def test_parent_entries_released_with_child():
+    from uzi.graph.core import DepKey
+
+    class Foo:
+        pass
+
+    class Bar:
+        pass
+
+    root = Graph(Container().provide(Foo, Bar))
+    child = Graph(Container(), root)
+    assert child[Foo]
+    keys = [k for k in root if isinstance(k, DepKey)]
+    assert any(k.container is child.container for k in keys)
+
+    del child
+    gc.collect()
+    assert root[Bar]
+    assert not any(k.container is None for k in root if isinstance(k, DepKey))
@@ -10,7 +10,7 @@ from collections.abc import Callable, Iterator, Mapping
 from uzi.containers import Container
 from uzi.exceptions import FinalProviderOverrideError, ProError
 from uzi.providers import Provider
-from uzi.graph.nodes import Node
+from uzi.graph.nodes import MissingNode, Node
 from uzi.graph.core import NullGraph, Graph
 
 
@@ -304,3 +304,250 @@ def _test_find_remote(new: _T_FnNew, mock_graph: Graph, mock_provider: Provider)
     assert isinstance(ldep, Node)
     assert sub[_T] is ldep
     assert sub.find_remote(_T) is rdep
+
+
+def test_hoist_shared_nodes():
+    class Foo:
+        pass
+
+    class Bar:
+        def __init__(self, foo: Foo) -> None:
+            pass
+
+    class Baz:
+        def __init__(self, bar: Bar) -> None:
+            pass
+
+    root = Graph(Container().provide(Foo))
+    base = Container().provide(Bar, Baz)
+    sub_a = Graph(Container().extend(base), root)
+    sub_b = Graph(Container().extend(base), root)
+
+    assert sub_a[Baz] is sub_b[Baz]
+    assert sub_a[Bar] is sub_b[Bar]
+    assert sub_a[Baz].graph is sub_a[Bar].graph is root
+    assert sub_a.owns(sub_a[Baz]) and sub_b.owns(sub_b[Bar])
+    assert not sub_a.owns(sub_a[Foo])
+    assert Bar not in root and Baz not in root
+
+
+def test_no_hoist_local_or_shared_nodes():
+    class Foo:
+        pass
+
+    class Bar:
+        def __init__(self, foo: Foo) -> None:
+            pass
+
+    root = Graph(Container())
+    container = Container().provide(Bar)
+    container.singleton(Foo)
+    sub = Graph(container, root)
+
+    assert sub[Foo].graph is sub[Bar].graph is sub
+    assert sub.owns(sub[Foo]) and sub.owns(sub[Bar])
+    assert not root.hoisted
+
+
+def test_hoisted_nodes_do_not_outlive_graphs():
+    import gc
+    from weakref import ref
+
+    class Foo:
+        pass
+
+    class Bar:
+        def __init__(self, foo: Foo) -> None:
+            pass
+
+    root = Graph(Container().provide(Foo))
+    base = Container().provide(Bar)
+    tenants = [Graph(Container().provide(Bar), root) for _ in range(10)]
+    assert all(g[Bar].graph is g for g in tenants)
+    assert not root.hoisted
+
+    subs = [Graph(Container().extend(base), root) for _ in range(10)]
+    assert all(g[Bar] is subs[0][Bar] for g in subs)
+    assert len(root.hoisted) == 1
+
+    refs = [ref(g) for g in tenants + subs]
+    del tenants, subs
+    gc.collect()
+    assert not any(r() for r in refs)
+    assert not root.hoisted
+
+
+def test_resolve_marker_instances():
+    from uzi.graph import nodes
+    from uzi.markers import Dep, Lookup
+
+    class Foo:
+        a = 1
+
+    graph = Graph(Container().provide(Foo))
+    assert isinstance(graph[Dep(_T, default=1)], nodes.Value)
+    assert graph[Dep(Foo, default=1)] is graph[Foo]
+    assert isinstance(graph[Lookup(Foo).a], nodes.Factory)
+
+
+def test_get_node():
+    class Foo:
+        pass
+
+    class Bar:
+        pass
+
+    container = Container().provide(Foo)
+    graph = Graph(container)
+    assert graph.get_node(Foo) is graph[Foo]
+    assert graph.get_node(Bar) is None
+    assert graph.get_node(Bar, default=123) == 123
+    assert Bar in graph._v_misses
+
+    container.provide(Bar)
+    assert graph.get_node(Bar) is graph[Bar]
+    assert Bar not in graph._v_misses
+
+
+def test_null_graph_get_node():
+    assert NullGraph().get_node(_T, 123) == 123
+
+
+def test_negative_cache():
+    class Foo:
+        pass
+
+    class Bar:
+        pass
+
+    root = Container()
+    container = Container().extend(root)
+    graph = Graph(container, Graph(root))
+
+    miss = graph[Bar]
+    assert not miss
+    assert isinstance(miss, MissingNode)
+    pdep = graph.parent.make_key(Bar, graph._parent_accessor(graph.make_key(Bar)))
+    assert pdep.container is container
+    assert miss is graph.parent[pdep]
+    assert miss is NullGraph()[Bar]
+
+    info, pinfo = graph.resolution_info(), graph.parent.resolution_info()
+    assert (info.missed, info.miss_hits, info.currsize) == (1, 0, 1)
+    assert (pinfo.missed, pinfo.currsize) == (1, 1)
+
+    assert graph[Bar] is miss
+    assert graph.resolution_info().miss_hits == 1
+    assert graph.parent.resolution_info().miss_hits == 1
+
+    root.provide(Foo, Bar)
+    info = graph.resolution_info()
+    assert (info.invalidated, info.currsize) == (1, 0)
+    assert graph[Bar] and graph[Foo]
+    assert graph.resolution_info().resolved == 2
+
+
+def test_single_flight_resolution():
+    from collections import Counter
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Barrier
+    from time import sleep
+
+    class Foo:
+        pass
+
+    class Bar:
+        def __init__(self, foo: Foo) -> None:
+            pass
+
+    calls = Counter()
+
+    class SlowGraph(Graph):
+        def find_provider(self, dep):
+            calls[dep.abstract] += 1
+            sleep(0.01)
+            return super().find_provider(dep)
+
+    n = 16
+    graph = SlowGraph(Container().provide(Foo, Bar))
+    barrier = Barrier(n)
+
+    def resolve():
+        barrier.wait()
+        return graph[Bar], graph[Foo]
+
+    with ThreadPoolExecutor(n) as pool:
+        res = [f.result() for f in [pool.submit(resolve) for _ in range(n)]]
+
+    assert all(r == res[0] for r in res)
+    assert all(a is b for r in res for a, b in zip(r, res[0]))
+    assert calls == {Bar: 1, Foo: 1}
+    assert not graph._v_flights
+
+
+def test_single_flight_no_deadlock():
+    from concurrent.futures import ThreadPoolExecutor
+    from time import sleep
+
+    from uzi._common import Missing
+    from uzi.graph.core import _Flight, _waiting
+
+    ours, theirs = _Flight(), []
+
+    def other():
+        theirs.append(_Flight())
+        return ours.wait()
+
+    with ThreadPoolExecutor(1) as pool:
+        fut = pool.submit(other)
+        while not any(f is ours for f in list(_waiting.values())):
+            sleep(0.001)
+
+        # `other` waits for `ours` so waiting for `theirs` would deadlock.
+        assert theirs[0].wait() is Missing
+        assert not fut.done()
+
+        ours.result = 123
+        ours.done()
+        assert fut.result() == 123
+    assert not _waiting
+
+
+def test_filters_see_child_container():
+    from uzi.scopes import Scope
+
+    class Foo:
+        pass
+
+    seen = []
+    root, a, b = Container(), Container(), Container()
+
+    def when(p, dep, g):
+        seen.append(dep.container)
+        return not dep.container is b
+
+    root.factory(Foo).when(when)
+    parent = Scope(root)
+    assert Scope(a, parent).graph[Foo]
+    assert not Scope(b, parent).graph[Foo]
+    assert a in seen and b in seen
+
+
+def test_generic_origin_fallback(monkeypatch):
+    class Foo(t.Generic[_T]):
+        pass
+
+    container = Container()
+    container.factory(Foo)
+    graph = Graph(container)
+
+    calls = []
+    find_providers = Graph.find_providers
+
+    def spy(self, dep):
+        calls.append(dep.abstract)
+        return find_providers(self, dep)
+
+    monkeypatch.setattr(Graph, "find_providers", spy)
+    assert graph[Foo[int]] is graph[Foo]
+    assert calls == [Foo[int], Foo]
@@ -0,0 +1,84 @@
+import typing as t
+import pytest
+
+
+from uzi._common import Missing
+from uzi.markers import (
+    Dep,
+    Injectable,
+    InjectableKind,
+    Lookup,
+    PureDep,
+    injectable_kind,
+    is_dependency_marker,
+    is_injectable,
+)
+
+
+xfail = pytest.mark.xfail
+parametrize = pytest.mark.parametrize
+
+
+_T = t.TypeVar("_T")
+
+
+class Foo:
+    pass
+
+
+def func():
+    ...  # pragma: no cover
+
+
+@parametrize(
+    ["obj", "kind"],
+    [
+        (Foo, InjectableKind.injectable),
+        (func, InjectableKind.injectable),
+        (_T, InjectableKind.injectable),
+        (list[Foo], InjectableKind.injectable),
+        (t.List[Foo], InjectableKind.injectable),
+        (Dep(Foo), InjectableKind.marker),
+        (PureDep(Foo), InjectableKind.marker),
+        (Lookup(Foo).a, InjectableKind.marker),
+        (Dep, InjectableKind.marker),
+        (t.Union, InjectableKind.union),
+        (t.Union[Foo, _T], InjectableKind.union),
+        (t.Optional[Foo], InjectableKind.union),
+        (t.Annotated, InjectableKind.annotated),
+        (t.Annotated[Foo, Dep(Foo)], InjectableKind.annotated),
+        (None, InjectableKind.non_injectable),
+        (int, InjectableKind.non_injectable),
+        (list, InjectableKind.non_injectable),
+        (t.Any, InjectableKind.non_injectable),
+        (t.Literal[1], InjectableKind.non_injectable),
+        (Missing, InjectableKind.non_injectable),
+        (Foo | int, InjectableKind.non_injectable),
+        ("abc", InjectableKind.non_injectable),
+        (1, InjectableKind.non_injectable),
+    ],
+)
+def test_injectable_kind(obj, kind: InjectableKind):
+    for _ in range(2):
+        assert injectable_kind(obj) is kind
+        assert is_injectable(obj) is kind.is_injectable
+        assert is_dependency_marker(obj) is kind.is_marker
+
+
+def test_cache_invalidation():
+    class Thing:
+        pass
+
+    thing = Thing()
+    assert injectable_kind(thing) is InjectableKind.non_injectable
+    Injectable.register(Thing)
+    assert injectable_kind(thing) is InjectableKind.injectable
+
+
+def test_value_cache_is_bounded():
+    from uzi.markers import _kinds_by_value
+
+    maxsize = _kinds_by_value.cache_info().maxsize
+    for i in range(maxsize + 10):
+        assert injectable_kind(t.TypeVar(f"T{i}")) is InjectableKind.injectable
+    assert _kinds_by_value.cache_info().currsize <= maxsize
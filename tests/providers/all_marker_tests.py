@@ -0,0 +1,66 @@
+import typing as t
+
+import pytest
+from uzi.containers import Container
+from uzi.markers import All
+from uzi.providers import AllMarkerProvider as Provider
+from uzi.scopes import Scope
+
+from .abc import ProviderTestCase, _T_NewPro
+
+xfail = pytest.mark.xfail
+parametrize = pytest.mark.parametrize
+
+
+_Tx = t.TypeVar("_Tx")
+Handler = t.TypeVar("Handler")
+
+_T_NewPro = _T_NewPro[Provider]
+
+
+class AllMarkerTests(ProviderTestCase[Provider]):
+    @pytest.fixture
+    def abstract(self):
+        return All[_Tx]
+
+    @pytest.fixture
+    def new_args(self):
+        return ()
+
+    def test_all(self):
+        c1, c2 = Container(), Container()
+        c1.value(Handler, 1)
+        c2.factory(Handler, lambda: 2)
+        c2.value(_Tx, "private").private()
+        container = Container().extend(c1, c2)
+        container.value(Handler, 3)
+
+        root = Container()
+        root.value(Handler, 0)
+
+        scope = Scope(container, Scope(root))
+        injector = scope.injector()
+        assert injector.make(Handler) == 3
+        assert injector.make(All[Handler]) == (3, 1, 2, 0)
+        assert injector.make(All[_Tx]) == ()
+
+    def test_find_providers(self):
+        c1 = Container()
+        p1 = c1.value(Handler, 1)
+        container = Container().extend(c1)
+        p2 = container.value(Handler, 2)
+        graph = Scope(container).graph
+        assert graph.find_providers(graph.make_key(Handler)) == [p2, p1]
+        assert graph.find_provider(graph.make_key(Handler)) is p2
+
+    async def test_async(self):
+        async def make_handler():
+            return 2
+
+        c1 = Container()
+        c1.value(Handler, 1)
+        container = Container().extend(c1)
+        container.factory(Handler, make_handler)
+        injector = Scope(container).injector()
+        assert injector.graph[All[Handler]].is_async
+        assert await injector.make(All[Handler]) == (2, 1)
@@ -6,6 +6,7 @@ import pytest
 
 import typing as t
 from uzi import Dep
+from uzi._common import Missing
 
 
 from uzi.providers import Factory as Provider
@@ -35,3 +36,93 @@ class FactoryProviderTests(ProviderTestCase[Provider]):
         subject.use(partial(subject.concrete))
         sig = subject.get_signature()
         assert isinstance(sig, Signature)
+
+    def test_shared_params(self):
+        class Foo:
+            pass
+
+        class Bar:
+            def __init__(self, foo: Foo) -> None:
+                pass
+
+        from uzi.containers import Container
+        from uzi.scopes import Scope
+
+        root = Scope(Container().provide(Foo))
+        base = Container()
+        # singletons are never hoisted into the parent graph (see `Graph.hoist`)
+        base.singleton(Bar)
+
+        g1 = Scope(Container().extend(base), root).graph
+        g2 = Scope(Container().extend(base), root).graph
+        assert g1[Bar] is not g2[Bar]
+        assert g1[Bar].params is g2[Bar].params
+
+        g3 = Scope(Container().extend(base).provide(Foo), root).graph
+        assert g3[Bar].params is not g1[Bar].params
+        assert g3[Bar].params.params[0].dependency is g3[Foo]
+
+    async def test_in_executor(self, new: _T_NewPro):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from uzi.containers import Container
+        from uzi.scopes import Scope
+
+        class Foo:
+            def __init__(self) -> None:
+                self.thread = threading.get_ident()
+
+        class Bar:
+            def __init__(self, foo: Foo) -> None:
+                self.foo = foo
+
+        subject = new(Foo)
+        assert subject.executor is Missing
+        with ThreadPoolExecutor(1) as executor:
+            assert subject.in_executor(executor) is subject
+            assert subject.executor is executor
+
+            container = Container()
+            container[Foo] = subject
+            container.factory(Bar)
+
+            injector = Scope(container).injector()
+            graph = injector.graph
+            assert graph[Foo].is_async and graph[Bar].is_async
+
+            foo = await injector[graph[Foo]]()
+            bar = await injector[graph[Bar]]()
+            assert isinstance(foo, Foo) and isinstance(bar.foo, Foo)
+            assert foo.thread == bar.foo.thread != threading.get_ident()
+
+    async def test_eager_async_params(self, new: _T_NewPro):
+        from uzi.containers import Container
+        from uzi.scopes import Scope
+
+        class Foo:
+            pass
+
+        class Bar:
+            def __init__(self, foo: Foo) -> None:
+                self.foo = foo
+
+        async def make_foo():
+            await asyncio.sleep(0)
+            return Foo()
+
+        container = Container()
+        container.singleton(Foo, make_foo)
+        container[Bar] = new(Bar)
+
+        injector = Scope(container).injector()
+        make_bar = injector.bound(Bar)
+
+        cold = make_bar()
+        assert not cold.done()
+        foo = (await cold).foo
+
+        warm = make_bar()
+        assert asyncio.isfuture(warm) and warm.done()
+        bar = await warm
+        assert isinstance(bar, Bar) and bar.foo is foo
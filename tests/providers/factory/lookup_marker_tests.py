@@ -46,3 +46,85 @@ class LookupMarkerProviderTests(ProviderTestCase[Provider]):
     def mock_injector(self, mock_graph, mock_injector):
         mock_injector[mock_graph[Foo]] = MagicMock(type[Foo], wraps=Foo)
         return mock_injector
+
+    def test_fold_singleton_root(self):
+        from unittest.mock import Mock
+
+        from uzi.containers import Container
+        from uzi.graph import nodes
+        from uzi.scopes import Scope
+
+        class Config:
+            def __init__(self) -> None:
+                self.db = Mock(url="db://")
+
+        def handler(url: t.Annotated[str, Lookup(Config).db.url]):
+            return url
+
+        container = Container()
+        container.singleton(Config)
+        container.factory(_Ta, handler)
+        container.value(_Tx, Config())
+        injector = Scope(container).injector()
+        graph = injector.graph
+
+        folded = graph[Lookup(Config).db.url]
+        assert isinstance(folded, nodes.Singleton)
+        assert isinstance(graph[Lookup(_Tx).db.url], nodes.Singleton)
+        assert injector[folded]() == "db://"
+        assert injector.make(_Ta) == "db://"
+
+        config = injector.make(Config)
+        config.db = Mock(url="changed://")
+        assert injector[folded]() == "db://"
+
+    def test_no_fold_factory_root(self):
+        from uzi.containers import Container
+        from uzi.graph import nodes
+        from uzi.scopes import Scope
+
+        container = Container()
+        container.factory(Foo)
+        graph = Scope(container).graph
+        node = graph[Lookup(Foo).a["data"]["bee"]]
+        assert isinstance(node, nodes.Factory)
+        assert not isinstance(node, nodes.Singleton)
+
+    def test_annotated_lookups(self):
+        from uzi.containers import Container
+        from uzi.markers import Dep
+        from uzi.scopes import Scope
+
+        class Bar:
+            pass
+
+        class Baz:
+            def __init__(self, bar: Bar) -> None:
+                self.bar = bar
+
+        class Holder:
+            def __init__(self, bar: Bar, baz: Baz) -> None:
+                self.deps = "holder", bar, baz
+
+        def good(bar: t.Annotated[Bar, Dep(Holder).lookup.deps[::-1][0].bar]):
+            return bar
+
+        def bad(bar: t.Annotated[Bar, Dep(Holder).lookup.deps[1::-1][0].bar]):
+            return bar  # pragma: no cover
+
+        container = Container().provide(Bar, Baz)
+        container.singleton(Holder)
+        container.factory(_Ta, good)
+        container.factory(_Tx, bad)
+        injector = Scope(container).injector()
+
+        # Lookups in `Annotated` metadata are resolved instead of falling back
+        # to the annotated type.
+        holder = injector.make(Holder)
+        assert injector.make(_Ta) is holder.deps[2].bar
+        assert not injector.make(_Ta) is holder.deps[1]
+
+        # `deps[1::-1][0]` is the `Bar` which has no `bar`. This used to
+        # silently resolve to a new `Bar`.
+        with pytest.raises((AttributeError, TypeError)):
+            injector.make(_Tx)
@@ -0,0 +1,111 @@
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+import typing as t
+
+
+from uzi.containers import Container
+from uzi.graph import nodes
+from uzi.providers import ResolutionScoped as Provider
+from uzi.scopes import Scope
+
+
+from ..abc import _T_NewPro, ProviderTestCase
+
+
+xfail = pytest.mark.xfail
+parametrize = pytest.mark.parametrize
+
+
+_T_NewPro = _T_NewPro[Provider]
+
+
+class Foo:
+    pass
+
+
+class Bar:
+    def __init__(self, foo: Foo) -> None:
+        self.foo = foo
+
+
+class Baz:
+    def __init__(self, bar: Bar, foo: Foo) -> None:
+        self.bar, self.foo = bar, foo
+
+
+class Service:
+    def __init__(self, bar: Bar, baz: Baz, foo: Foo) -> None:
+        self.bar, self.baz, self.foo = bar, baz, foo
+
+
+class ResolutionScopedProviderTests(ProviderTestCase[Provider]):
+    def test_shared_within_resolution(self, new: _T_NewPro):
+        container = Container().provide(Bar, Baz, Service)
+        container[Foo] = new(Foo)
+        injector = Scope(container).injector()
+
+        service = injector.make(Service)
+        assert service.foo is service.bar.foo is service.baz.foo
+        assert service.baz.bar.foo is service.foo
+        assert service.baz.bar is not service.bar
+
+        other = injector.make(Service)
+        assert other.foo is not service.foo
+        assert injector.make(Foo) is not injector.make(Foo)
+
+    def test_plain_factories_are_not_wrapped(self, new: _T_NewPro):
+        container = Container().provide(Bar, Baz, Service)
+        container.factory(Foo)
+        graph = Scope(container).graph
+        assert graph[Service].__class__ is nodes.Factory
+
+        container = Container().provide(Bar, Baz, Service)
+        container[Foo] = new(Foo)
+        graph = Scope(container).graph
+        assert isinstance(graph[Bar], nodes._ResolutionRoot)
+        assert isinstance(graph[Service], nodes.Factory)
+        assert isinstance(graph[Service], nodes._ResolutionRoot)
+
+    def test_callable_and_singleton_roots(self, new: _T_NewPro):
+        Handler = t.TypeVar("Handler")
+
+        def handler(bar: Bar, baz: Baz):
+            return bar, baz
+
+        container = Container().provide(Bar, Baz)
+        container.singleton(Service)
+        container.callable(Handler, handler)
+        container[Foo] = new(Foo)
+        injector = Scope(container).injector()
+
+        func = injector.make(Handler)
+        bar, baz = func()
+        assert bar.foo is baz.foo is baz.bar.foo
+        assert func()[0].foo is not bar.foo
+
+        service = injector.make(Service)
+        assert service.foo is service.bar.foo is service.baz.foo
+        assert injector.make(Service) is service
+
+    def test_async_dependants(self, new: _T_NewPro):
+        async def make_bar(foo: Foo):
+            return Bar(foo)
+
+        container = Container()
+        container.factory(Bar, make_bar)
+        container[Foo] = new(Foo)
+        with pytest.raises(TypeError):
+            Scope(container).graph[Bar]
+
+    def test_threads(self, new: _T_NewPro):
+        container = Container().provide(Bar, Baz, Service)
+        container.resolution_scoped(Foo)
+        func = Scope(container).injector().bound(Service)
+
+        def check(_):
+            service = func()
+            return service.foo is service.bar.foo is service.baz.foo
+
+        with ThreadPoolExecutor(4) as pool:
+            assert all(pool.map(check, range(200)))
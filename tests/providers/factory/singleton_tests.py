@@ -1,10 +1,15 @@
 import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
 import pytest
 
 import typing as t
 
 
+from uzi._common import Missing
+from uzi.containers import Container
 from uzi.providers import Singleton as Provider
+from uzi.scopes import Scope
 
 
 from ..abc import _T_NewPro, ProviderTestCase
@@ -17,6 +22,23 @@ parametrize = pytest.mark.parametrize
 _T_NewPro = _T_NewPro[Provider]
 
 
+class Config:
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+
+
+def build_table(config: Config, size: int = 4):
+    return os.getpid(), config.pid, list(range(size))
+
+
+Table = t.TypeVar("Table")
+OtherTable = t.TypeVar("OtherTable")
+
+
+async def async_config():
+    return Config()
+
+
 class SingletonProviderTests(ProviderTestCase[Provider]):
     def test_is_thread_safe(self, new: _T_NewPro):
         subject = new()
@@ -26,3 +48,55 @@ class SingletonProviderTests(ProviderTestCase[Provider]):
         assert not subject.is_thread_safe
         subject.thread_safe()
         assert subject.is_thread_safe
+
+    def test_thread_safe_by_default(self, new: _T_NewPro):
+        from concurrent.futures import ThreadPoolExecutor
+        from threading import Barrier
+        from time import sleep
+
+        N, calls = 8, []
+
+        def func():
+            calls.append(None)
+            sleep(0.01)
+            return object()
+
+        container = Container()
+        container[Table] = subject = new(func)
+        assert subject.is_thread_safe is None
+        func = Scope(container).injector().bound(Table)
+        barrier = Barrier(N)
+
+        def call():
+            barrier.wait()
+            return func()
+
+        with ThreadPoolExecutor(N) as pool:
+            res = [f.result() for f in [pool.submit(call) for _ in range(N)]]
+        assert all(v is res[0] for v in res)
+        assert len(calls) == 1
+
+    def test_in_process(self, new: _T_NewPro):
+        subject = new(build_table)
+        assert subject.process_pool is Missing
+        assert subject.in_process() is subject
+        assert subject.process_pool is None
+
+        with ProcessPoolExecutor(2) as pool:
+            container = Container()
+            container.factory(Config)
+            container[Table] = new(build_table).in_process(pool)
+            container[OtherTable] = new(build_table, size=2).in_process(pool)
+
+            injector = Scope(container).injector()
+            table, other = injector.warmup(Table, OtherTable)
+            assert injector.make(Table) is table
+            assert table[1] == os.getpid() != table[0]
+            assert table[2] == [0, 1, 2, 3] and other[2] == [0, 1]
+
+    @xfail(raises=TypeError, strict=True)
+    def test_in_process_async_deps(self, new: _T_NewPro):
+        container = Container()
+        container.factory(Config, async_config)
+        container[Table] = new(build_table).in_process()
+        Scope(container).graph[Table]
@@ -0,0 +1,76 @@
+import typing as t
+from collections.abc import Mapping
+
+import pytest
+from uzi.containers import Container
+from uzi.markers import Keyed
+from uzi.providers import KeyedMarkerProvider as Provider
+from uzi.scopes import Scope
+
+from .abc import ProviderTestCase, _T_NewPro
+
+xfail = pytest.mark.xfail
+parametrize = pytest.mark.parametrize
+
+
+_Tx = t.TypeVar("_Tx")
+Command = t.TypeVar("Command")
+
+_T_NewPro = _T_NewPro[Provider]
+
+
+class KeyedMarkerTests(ProviderTestCase[Provider]):
+    @pytest.fixture
+    def abstract(self):
+        return Keyed[_Tx]
+
+    @pytest.fixture
+    def new_args(self):
+        return ()
+
+    def test_marker(self):
+        assert Keyed[Command] == Keyed(Command)
+        assert Keyed(Command, "a") == Keyed(Command, "a")
+        assert Keyed(Command, "a") != Keyed(Command, "b")
+        assert Keyed(Command, "a") != Keyed(Command)
+        assert Keyed(Command, "a").key == "a"
+        assert Keyed(Command, "a").abstract is Command
+
+    def test_keyed(self):
+        calls = []
+
+        def make_start():
+            calls.append("start")
+            return "start"
+
+        base = Container()
+        base.factory(Keyed(Command, "start"), make_start)
+        base.value(Keyed(Command, "stop"), "base-stop")
+        base.value(Keyed(_Tx, "other"), "other")
+        container = Container().extend(base)
+        container.value(Keyed(Command, "stop"), "stop")
+
+        root = Container()
+        root.value(Keyed(Command, "stop"), "root-stop")
+        root.value(Keyed(Command, "status"), "status")
+
+        injector = Scope(container, Scope(root)).injector()
+        commands = injector.make(Keyed[Command])
+        assert isinstance(commands, Mapping)
+        assert injector.make(Keyed[Command]) is commands
+        assert set(commands) == {"start", "stop", "status"}
+        assert not calls
+
+        assert commands["start"] == "start"
+        assert commands["start"] == "start"
+        assert calls == ["start", "start"]
+        assert commands["stop"] == "stop"
+        assert commands["status"] == "status"
+        assert injector.make(Keyed(Command, "stop")) == "stop"
+        with pytest.raises(KeyError):
+            commands["other"]
+
+    def test_empty(self):
+        injector = Scope(Container()).injector()
+        assert len(injector.make(Keyed[Command])) == 0
+        assert not injector.graph[Keyed(Command, "start")]
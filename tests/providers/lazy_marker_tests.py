@@ -0,0 +1,81 @@
+import typing as t
+
+import pytest
+from uzi.containers import Container
+from uzi.markers import Lazy
+from uzi.providers import LazyMarkerProvider as Provider
+from uzi.scopes import Scope
+
+from .abc import ProviderTestCase, _T_NewPro
+
+xfail = pytest.mark.xfail
+parametrize = pytest.mark.parametrize
+
+
+_Tx = t.TypeVar("_Tx")
+
+_T_NewPro = _T_NewPro[Provider]
+
+
+class Foo:
+    pass
+
+
+class Bar:
+    def __init__(self, foo: Lazy[Foo]) -> None:
+        self.foo = foo
+
+
+class LazyMarkerTests(ProviderTestCase[Provider]):
+    @pytest.fixture
+    def abstract(self):
+        return Lazy[_Tx]
+
+    @pytest.fixture
+    def new_args(self):
+        return ()
+
+    def test_marker(self):
+        assert Lazy[Foo] == Lazy(Foo)
+        assert Lazy[Foo] != Lazy[Bar]
+        marker = Lazy[Foo]
+        assert Lazy(marker) is marker
+
+    def test_lazy(self):
+        calls = []
+
+        def make_foo():
+            calls.append(None)
+            return Foo()
+
+        container = Container().provide(Bar)
+        container.factory(Foo, make_foo)
+        injector = Scope(container).injector()
+
+        bar = injector.make(Bar)
+        assert callable(bar.foo) and not calls
+        foo = bar.foo()
+        assert isinstance(foo, Foo) and len(calls) == 1
+        assert bar.foo() is foo and len(calls) == 1
+        assert injector.make(Bar).foo() is not foo
+
+    async def test_async(self):
+        calls = []
+
+        async def make_foo():
+            calls.append(None)
+            return Foo()
+
+        container = Container().provide(Bar)
+        container.factory(Foo, make_foo)
+        injector = Scope(container).injector()
+
+        bar = injector.make(Bar)
+        foo = await bar.foo()
+        assert isinstance(foo, Foo)
+        assert await bar.foo() is foo
+        assert len(calls) == 1
+
+    def test_missing(self):
+        graph = Scope(Container().provide(Bar)).graph
+        assert not graph[Lazy[Foo]]
@@ -0,0 +1,53 @@
+import typing as t
+
+import pytest
+from uzi.containers import Container
+from uzi.markers import ProviderOf
+from uzi.providers import ProviderOfMarkerProvider as Provider
+from uzi.scopes import Scope
+
+from .abc import ProviderTestCase, _T_NewPro
+
+xfail = pytest.mark.xfail
+parametrize = pytest.mark.parametrize
+
+
+_Tx = t.TypeVar("_Tx")
+
+_T_NewPro = _T_NewPro[Provider]
+
+
+class Foo:
+    pass
+
+
+class Bar:
+    def __init__(self, make: ProviderOf[Foo]) -> None:
+        self.make = make
+
+
+class ProviderOfMarkerTests(ProviderTestCase[Provider]):
+    @pytest.fixture
+    def abstract(self):
+        return ProviderOf[_Tx]
+
+    @pytest.fixture
+    def new_args(self):
+        return ()
+
+    def test_marker(self):
+        assert ProviderOf[Foo] == ProviderOf(Foo)
+        assert ProviderOf[Foo] != ProviderOf[Bar]
+
+    def test_provider_of(self):
+        container = Container().provide(Foo, Bar)
+        injector = Scope(container).injector()
+
+        bar = injector.make(Bar)
+        assert bar.make is injector[injector.graph[Foo]]
+        assert isinstance(bar.make(), Foo)
+        assert bar.make() is not bar.make()
+
+    def test_missing(self):
+        graph = Scope(Container().provide(Bar)).graph
+        assert not graph[ProviderOf[Foo]]
@@ -0,0 +1,103 @@
+import typing as t
+
+import pytest
+from uzi.containers import Container
+from uzi.graph.nodes import Node
+from uzi.providers import Factory, Singleton, Template as Provider
+from uzi.scopes import Scope
+
+from .abc import ProviderTestCase, _T_NewPro
+
+xfail = pytest.mark.xfail
+parametrize = pytest.mark.parametrize
+
+
+_T = t.TypeVar("_T")
+
+_T_NewPro = _T_NewPro[Provider]
+
+
+class Repo(t.Generic[_T]):
+    def __init__(self, model: type[_T]) -> None:
+        self.model = model
+
+
+class User:
+    pass
+
+
+class Post:
+    pass
+
+
+class Service:
+    def __init__(self, users: Repo[User], posts: Repo[Post]) -> None:
+        self.users, self.posts = users, posts
+
+
+class TemplateProviderTests(ProviderTestCase[Provider]):
+    @pytest.fixture
+    def abstract(self):
+        return Repo[User]
+
+    @pytest.fixture
+    def concrete(self):
+        return lambda model: Factory(Repo, model)
+
+    def test__make_node(self, new: _T_NewPro, abstract, mock_graph):
+        assert isinstance(new()._make_node(abstract, mock_graph), Node)
+
+    def test_resolve(self, new: _T_NewPro, abstract, mock_graph):
+        subject = new()
+        assert isinstance(subject._resolve(abstract, mock_graph), Node)
+        assert subject._resolve(Repo, mock_graph) is None
+
+    def test_get_provider(self, new: _T_NewPro):
+        subject = new(lambda model: Repo)
+        pro = subject.get_provider(User)
+        assert isinstance(pro, Factory)
+        assert pro.concrete is Repo
+        assert subject.get_provider(User) is pro
+        assert subject.get_provider(Post) is not pro
+
+    def test_template(self):
+        calls = []
+
+        def repo(model):
+            calls.append(model)
+            return Singleton(Repo, model)
+
+        container = Container().provide(Service)
+        container.template(Repo, repo)
+
+        injector = Scope(container).injector()
+        service = injector.make(Service)
+        assert service.users.model is User
+        assert service.posts.model is Post
+        assert injector.make(Repo[User]) is service.users
+        assert not injector.graph[Repo]
+
+        child = Scope(Container().provide(Service), Scope(container)).injector()
+        assert child.make(Service).users is not service.users
+        assert calls == [User, Post]
+
+    async def test_async_template(self):
+        async def make_repo(model):
+            return Repo(model)
+
+        container = Container()
+        container.template(Repo, lambda model: Factory(make_repo, model))
+        injector = Scope(container).injector()
+        assert injector.graph[Repo[User]].is_async
+        repo = await injector.make(Repo[User])
+        assert isinstance(repo, Repo) and repo.model is User
+
+    def test_filters(self):
+        def repo(model):
+            return Factory(Repo, model).when(lambda p, dep, g: model is User)
+
+        container = Container()
+        container.template(Repo, repo)
+        graph = Scope(container).graph
+        assert graph[Repo[User]]
+        assert not graph[Repo[Post]]
@@ -0,0 +1,220 @@
+import asyncio
+import sys
+import typing as t
+import pytest
+
+
+from collections import abc
+
+
+from uzi.containers import Container
+from uzi.exceptions import InvalidStateError
+from uzi.graph.core import Graph
+from uzi.injectors import AsyncInjector
+from uzi.scopes import AsyncScope, _CompatScopeTaskGroup
+
+
+xfail = pytest.mark.xfail
+parametrize = pytest.mark.parametrize
+
+
+_T = t.TypeVar("_T")
+_Ts = t.TypeVar("_Ts")
+_T_FnNew = abc.Callable[..., AsyncScope]
+
+
+from .scope_tests import (
+    test_push_pop_multiple_times,
+    test_push_multiple_times,
+    test_pop_multiple_times,
+)
+
+
+@pytest.fixture
+def new_args(MockContainer: type[Graph]):
+    return (MockContainer(),)
+
+
+@pytest.fixture
+def cls():
+    return AsyncScope
+
+
+async def test_async_with(cls: type[AsyncScope]):
+    sub, log = cls(Container()), []
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def first():
+        started.set()
+        await release.wait()
+        log.append("first")
+
+    async def second():
+        await started.wait()
+        release.set()
+        log.append("second")
+
+    async with sub as inj:
+        assert isinstance(inj, AsyncInjector)
+        assert sub.current is inj
+        inj.on_close(first)
+        inj.on_close(second)
+        inj.on_close(log.append, "sync")
+
+    assert not sub.active
+    assert log == ["sync", "second", "first"]
+
+    with pytest.raises(InvalidStateError):
+        await sub.apop()
+
+
+def test_sync_pop_with_async_teardown(cls: type[AsyncScope]):
+    import gc
+    import warnings
+
+    sub, log = cls(Container()), []
+
+    async def teardown():
+        log.append("async")  # pragma: no cover
+
+    inj = sub.injector()
+    inj.on_close(teardown)
+    inj.on_close(log.append, "sync")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(InvalidStateError, match="aclose"):
+            sub.pop()
+        gc.collect()
+    assert not sub.active
+    assert log == ["sync"]
+
+
+async def test_aclose_errors(cls: type[AsyncScope]):
+    sub, log = cls(Container()), []
+
+    async def fail():
+        raise ValueError()
+
+    inj = sub.injector()
+    inj.on_close(log.append, 1)
+    inj.on_close(fail)
+    with pytest.raises(ValueError):
+        await sub.apop()
+    assert log == [1]
+
+
+async def test_resources(cls: type[AsyncScope]):
+    from contextlib import asynccontextmanager, contextmanager
+
+    log = []
+
+    class Sync:
+        def __enter__(self):
+            log.append("enter sync")
+            return self
+
+        def __exit__(self, *err):
+            log.append("exit sync")
+
+    class Client:
+        async def aclose(self):
+            log.append("close client")
+
+    @asynccontextmanager
+    async def connect():
+        log.append("enter conn")
+        yield "conn"
+        log.append("exit conn")
+
+    @contextmanager
+    def session():
+        yield "session"
+        log.append("exit session")
+
+    container = Container()
+    container.resource(Sync)
+    container.resource(Client)
+    container.resource(_T, connect)
+    container.resource(_Ts, session)
+    sub = cls(container)
+
+    async with sub as inj:
+        assert isinstance(inj.make(Sync), Sync)
+        assert isinstance(inj.make(Client), Client)
+        assert await inj.make(_T) == await inj.make(_T) == "conn"
+        assert inj.make(_Ts) == "session"
+        assert log == ["enter sync", "enter conn"]
+        log.clear()
+
+    # async teardown is awaited after the sync callbacks are called
+    assert log[:2] == ["exit session", "exit sync"]
+    assert sorted(log[2:]) == ["close client", "exit conn"]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="requires TaskGroup")
+async def test_task_group(cls: type[AsyncScope]):
+    sub, closed = cls(Container()), []
+
+    async def current():
+        await asyncio.sleep(0)
+        return sub.current
+
+    async with sub.task_group() as tg:
+        inj = sub.current
+        inj.on_close(closed.append, inj)
+        a, b = tg.create_task(current()), tg.create_task(current())
+
+    assert a.result() is b.result() is inj
+    assert closed == [inj]
+    assert not sub.active
+
+    async with sub:
+        async with sub.task_group() as tg:
+            task = tg.create_task(current())
+        assert task.result() is sub.current
+        assert sub.active
+
+
+async def _check_task_group(sub: AsyncScope, new_group):
+    from contextvars import ContextVar
+
+    var, closed = ContextVar("var", default=None), []
+
+    async def current(val):
+        var.set(val)
+        await asyncio.sleep(0)
+        assert var.get() == val
+        return sub.current
+
+    async with new_group(sub) as tg:
+        inj = sub.current
+        inj.on_close(closed.append, inj)
+        a, b = tg.create_task(current(1)), tg.create_task(current(2))
+
+    assert a.result() is b.result() is inj
+    assert var.get() is None
+    assert closed == [inj]
+    assert not sub.active
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="requires TaskGroup")
+async def test_task_group_contexts(cls: type[AsyncScope]):
+    await _check_task_group(cls(Container()), cls.task_group)
+
+
+async def test_compat_task_group(cls: type[AsyncScope]):
+    sub = cls(Container())
+    await _check_task_group(sub, _CompatScopeTaskGroup)
+
+    async def fail():
+        raise ValueError()
+
+    async def forever():
+        await asyncio.Event().wait()
+
+    with pytest.raises(ValueError):
+        async with _CompatScopeTaskGroup(sub) as tg:
+            task = tg.create_task(forever())
+            tg.create_task(fail())
+    assert task.cancelled()
+    assert not sub.active
@@ -1,4 +1,6 @@
 import asyncio
+import sys
+from contextvars import copy_context
 from threading import Thread
 import typing as t
 from unittest.mock import MagicMock, patch
@@ -129,3 +131,45 @@ def test_in_multithread_setup(
 
         assert not sub.active
         assert sub._new_injector.call_count == N + 1
+
+
+def test_bind_context(cls: type[ContextLocalScope]):
+    from uzi.containers import Container
+
+    sub = cls(Container())
+    with sub.bind_context() as handle:
+        assert sub.active
+        assert handle.injector is sub.current
+        with sub.bind_context() as inner:
+            assert inner.injector is handle.injector
+        assert sub.active
+    assert not sub.active
+
+
+async def test_task_factory(cls: type[ContextLocalScope]):
+    from uzi.containers import Container
+
+    sub = cls(Container())
+    loop = asyncio.get_running_loop()
+    default = loop.get_task_factory()
+    loop.set_task_factory(sub.task_factory(default))
+
+    async def current():
+        return sub.current
+
+    try:
+        a, b = await asyncio.gather(current(), current())
+        assert a and b and not a is b
+        assert not sub.active
+
+        with sub.bind_context() as handle:
+            a, b = await asyncio.gather(current(), current())
+            assert a is b is handle.injector
+
+        if sys.version_info >= (3, 11):
+            context = copy_context()
+            task = loop.create_task(current(), context=context)
+            assert (await task) and not sub.active
+            assert not context.run(lambda: sub.current)
+    finally:
+        loop.set_task_factory(default)
@@ -77,3 +77,44 @@ def test_multithread(new: _T_FnNew, cls: type[ThreadLocalScope], MockInjector):
 
         assert len(seen) == N
         assert sub._new_injector.call_count == N + 1
+
+
+def test_template(cls: type[ThreadLocalScope]):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from uzi.containers import Container
+
+    class Config:
+        pass
+
+    class Service:
+        def __init__(self, config: Config) -> None:
+            self.config = config
+
+    class Handler:
+        pass
+
+    container = Container()
+    container.singleton(Config)
+    container.factory(Service)
+    container.factory(Handler)
+    container.value(_T, 123)
+
+    sub = cls(container)
+    template = sub.make_template(Service, Handler, _T)
+    assert {n.abstract for n in template} == {Handler, _T}
+
+    with ThreadPoolExecutor(2) as pool:
+        inj_a, inj_b = sub.prewarm(pool, Service, workers=2)
+        assert not inj_a is inj_b
+        assert inj_a.bound(Handler) is inj_b.bound(Handler)
+        assert inj_a.bound(_T) is inj_b.bound(_T)
+        assert not inj_a.bound(Service) is inj_b.bound(Service)
+        assert not inj_a.make(Config) is inj_b.make(Config)
+        assert inj_a.make(Service).config is inj_a.make(Config)
+        assert pool.submit(sub.injector).result() in (inj_a, inj_b)
+
+    with ThreadPoolExecutor(2) as pool:
+        with pytest.raises(TimeoutError):
+            sub.prewarm(pool, Service, workers=3, timeout=0.2)
+    assert not sub.active
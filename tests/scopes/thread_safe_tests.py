@@ -61,7 +61,7 @@ def test_multithread(new: _T_FnNew, cls: type[ThreadSafeScope], MockInjector):
         res = [None] * N
 
         def func(n):
-            res[n] = sub.active, sub.lock.locked(), sub.injector()
+            res[n] = sub.active, sub.injector()
 
         threads = [Thread(target=func, args=(i,)) for i in range(N)]
 
@@ -69,15 +69,93 @@ def test_multithread(new: _T_FnNew, cls: type[ThreadSafeScope], MockInjector):
         *(t.join() for t in threads),
 
         seen = set()
-        for i, (active, locked, val) in enumerate(res):
-            print(f"{i} -> {active=}, {locked=} {val=}")
+        for i, (active, val) in enumerate(res):
+            print(f"{i} -> {active=}, {val=}")
             if i == 0:
                 assert not active
-                assert not locked
             else:
-                assert active or locked
                 assert val in seen
             seen.add(val)
 
         sub.pop()
         sub._new_injector.assert_called_once()
+
+
+def test_concurrent_injector(cls: type[ThreadSafeScope]):
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Barrier
+
+    from uzi.containers import Container
+
+    N = 16
+    sub, barrier = cls(Container()), Barrier(N)
+
+    def func():
+        barrier.wait()
+        return sub.injector()
+
+    with ThreadPoolExecutor(N) as pool:
+        res = [f.result() for f in [pool.submit(func) for _ in range(N)]]
+
+    assert all(inj is res[0] for inj in res)
+    sub.pop()
+
+
+def test_failed_push(cls: type[ThreadSafeScope]):
+    from uzi.containers import Container
+
+    sub = cls(Container())
+    with patch.object(cls, "_new_injector", side_effect=RuntimeError):
+        with pytest.raises(RuntimeError):
+            sub.injector()
+        assert not sub.active
+
+    inj = sub.injector()
+    assert sub.active and sub.current is inj
+    sub.pop()
+    assert not sub.active
+
+
+def test_pop_injector_race(cls: type[ThreadSafeScope]):
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Barrier
+    from time import sleep
+
+    from uzi.containers import Container
+    from uzi.exceptions import InvalidStateError
+
+    N, R = 8, 2000
+    sub, barrier = cls(Container()), Barrier(N)
+    created, closed = [], []
+
+    class Injector:
+        def __init__(self) -> None:
+            sleep(0)
+            created.append(self)
+
+        def close(self):
+            closed.append(self)
+
+    def func():
+        barrier.wait()
+        for _ in range(R):
+            assert isinstance(sub.injector(), Injector)
+            try:
+                sub.pop()
+            except InvalidStateError:
+                pass
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with patch.object(cls, "_new_injector", side_effect=Injector):
+            with ThreadPoolExecutor(N) as pool:
+                for fut in [pool.submit(func) for _ in range(N)]:
+                    fut.result()
+    finally:
+        sys.setswitchinterval(interval)
+
+    sub.active and sub.pop()
+    assert not sub.active
+    assert len(created) == len(closed) == len({*map(id, closed)})
@@ -6,10 +6,15 @@ from .markers import (
     is_injectable,
     T_Injected,
     T_Injectable,
+    All,
     Dep,
     DependencyMarker,
+    Keyed,
+    Lazy,
     Lookup,
+    ProviderOf,
     PureDep,
+    Resolved,
 )
 
 
@@ -18,9 +23,15 @@ from .exceptions import InjectorLookupError, UziException
 
 from . import injectors, providers
 from .containers import Container
-from .injectors import Injector
+from .injectors import AsyncInjector, Injector
 from .providers import Provider
-from .scopes import Scope, ThreadSafeScope, ThreadLocalScope, ContextLocalScope
+from .scopes import (
+    AsyncScope,
+    Scope,
+    ThreadSafeScope,
+    ThreadLocalScope,
+    ContextLocalScope,
+)
 
 
 from . import _receivers
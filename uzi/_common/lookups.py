@@ -1,6 +1,7 @@
 import typing as t
 from abc import abstractmethod
 from collections.abc import Callable, Hashable
+from operator import attrgetter, itemgetter
 
 from . import FrozenDict, private_setattr
 
@@ -178,17 +179,47 @@ class Call(Expression[tuple[_T_Args, _T_Kwargs], _T_Obj]):
 class Lookup(Expression[tuple[Expression[t.Any, _T_Obj]], _T_Obj], t.Generic[_T_Obj]):
     """A chain of lookup experesions."""
 
-    __slots__ = ("__expr__",)
+    __slots__ = (
+        "__expr__",
+        "_v_eval",
+    )
 
     __offset__ = None
 
     __expr__: tuple[Expression[_T_Expr, _T_Obj]]
+    _v_eval: tuple[Callable[[t.Any], t.Any]]
 
     def __new__(cls, *ops: Expression[_T_Expr, _T_Obj]):
         self = _object_new(cls)
-        self.__setattr(__expr__=ops)
+        self.__setattr(__expr__=ops, _v_eval=None)
         return self
 
+    def __compile__(self) -> tuple[Callable[[t.Any], t.Any]]:
+        """Compile the chain into a pipeline of getters.
+
+        Consecutive attributes are merged into a single `attrgetter`, items and
+        slices use `itemgetter`. Other expressions use their `__eval__`.
+        """
+        funcs, attrs = [], []
+        for op in self.__ops__:
+            cls = op.__class__
+            if cls is Attribute and not "." in op.__expr__:
+                attrs.append(op.__expr__)
+                continue
+            elif attrs:
+                funcs.append(attrgetter(".".join(attrs)))
+                attrs = []
+
+            if cls is Item:
+                funcs.append(itemgetter(op.__expr__))
+            elif cls is Slice:
+                funcs.append(itemgetter(slice(*op.__expr__)))
+            else:
+                funcs.append(op.__eval__)
+
+        attrs and funcs.append(attrgetter(".".join(attrs)))
+        return tuple(funcs)
+
     @property
     def __ops__(self) -> None:
         return self.__expr__[self.__offset__ :]
@@ -214,10 +245,14 @@ class Lookup(Expression[tuple[Expression[t.Any, _T_Obj]], _T_Obj], t.Generic[_T_
     def __eval__(self, /, root: _T_Obj, start: int = None, stop: int = None):
         __tracebackhide__ = True
         val = root
-        it = self.__ops__[start:stop]
+        if start is None is stop:
+            if (it := self._v_eval) is None:
+                self.__setattr(_v_eval=(it := self.__compile__()))
+        else:
+            it = (op.__eval__ for op in self.__ops__[start:stop])
         try:
-            for t in it:
-                val = t.__eval__(val)
+            for fn in it:
+                val = fn(val)
         except EvaluationError:
             raise
         except Exception as e:
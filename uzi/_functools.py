@@ -1,9 +1,26 @@
+import sys
 import typing as t
-from asyncio import AbstractEventLoop, Future, ensure_future, get_running_loop
-from collections.abc import Callable, ItemsView, Iterator, Mapping, ValuesView
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    Task,
+    ensure_future,
+    get_running_loop,
+)
+from collections.abc import (
+    Callable,
+    ItemsView,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    ValuesView,
+)
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import AbstractAsyncContextManager
-from inspect import Parameter, Signature
+from functools import partial
+from inspect import Parameter, Signature, iscoroutine
 from logging import getLogger
+from threading import Lock
 
 import attr
 from typing_extensions import Self
@@ -14,6 +31,7 @@ from .markers import Injectable, is_injectable_annotation
 from .markers import DependencyMarker
 
 if t.TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor, Future as ConcurrentFuture
     from .graph.nodes import Node
     from .containers import Container
     from .injectors import Injector
@@ -44,8 +62,16 @@ _object_new = object.__new__
 _object_setattr = object.__setattr__
 
 
+def _to_frozendict(val) -> FrozenDict:
+    return FrozenDict(val) if val else _frozendict
+
+
 class BoundParam:
-    """A bound param"""
+    """A bound param.
+
+    `param` is the `inspect.Parameter` held by the (cached) signature. It is
+    shared by all params bound from the same signature instead of being copied.
+    """
 
     __slots__ = (
         "param",
@@ -73,16 +99,20 @@ class BoundParam:
         self.dependency = self.injectable = None
         self.has_default = False
 
-        if isinstance(value, DependencyMarker):
+        if value is _EMPTY:
+            pass
+        elif isinstance(value, DependencyMarker):
             self.injectable = value
-        elif not value is _EMPTY:
+        else:
             self.value = value
 
-        if isinstance(param.default, DependencyMarker):
+        if (default := param.default) is _EMPTY:
+            pass
+        elif isinstance(default, DependencyMarker):
             if None is self.injectable:
-                self.injectable = param.default
+                self.injectable = default
         else:
-            self.has_default = not param.default is _EMPTY
+            self.has_default = True
 
         if None is self.injectable:
             annotation = param.annotation
@@ -132,7 +162,7 @@ class BoundParams:
     kwds: tuple[BoundParam] = attr.ib(converter=tuple)
     aw_kwds: tuple[str] = attr.ib(converter=tuple)
     is_async: bool = attr.ib()
-    vals: FrozenDict[str, t.Any] = attr.ib(converter=FrozenDict)
+    vals: FrozenDict[str, t.Any] = attr.ib(converter=_to_frozendict)
     _pos_vals: int = attr.ib(converter=int)
     _pos_deps: int = attr.ib(converter=int)
 
@@ -188,8 +218,31 @@ class BoundParams:
         container: "Container" = None,
         args: tuple = (),
         kwargs: dict = FrozenDict(),
+        *,
+        cache: MutableMapping[tuple, Self] = None,
+        key: t.Any = None,
     ) -> Self:
-        return cls.make(cls._iter_bind(sig, scope, container, args, kwargs))
+        """Bind the signature's parameters.
+
+        If a `cache` mapping is given, params with the same `key` and the same
+        dependency nodes are shared. i.e. sibling graphs resolving the same
+        provider against the same (inherited) dependencies get the same
+        `BoundParams`. Params with dependencies local to `scope` are never shared.
+        """
+        params = cls._iter_bind(sig, scope, container, args, kwargs)
+        if cache is None:
+            return cls.make(params)
+
+        params = tuple(params)
+        deps = tuple(p.dependency for p in params)
+        if any(d and d.graph is scope for d in deps):
+            return cls.make(params)
+
+        key = key, *deps
+        try:
+            return cache[key]
+        except KeyError:
+            return cache.setdefault(key, cls.make(params))
 
     @classmethod
     def _iter_bind(
@@ -321,6 +374,149 @@ class _KeywordDeps(dict[str, Callable[[], _T]], t.Generic[_T]):
     raw_values = dict.values
 
 
+class ExecutorWrapper:
+    """Wraps a blocking callable to run it in an `Executor` of the running event
+    loop. Calling the wrapper returns an `asyncio.Future`.
+    """
+
+    __slots__ = (
+        "func",
+        "executor",
+    )
+
+    func: Callable
+    executor: t.Optional["Executor"]
+
+    def __new__(cls, func: Callable, executor: "Executor" = None) -> Self:
+        self = _object_new(cls)
+        self.func = func
+        self.executor = executor
+        return self
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.func!r}, {self.executor!r})"
+
+    def __call__(self, *args, **kwargs) -> Future:
+        return get_running_loop().run_in_executor(
+            self.executor, partial(self.func, *args, **kwargs)
+        )
+
+
+_default_process_pool: ProcessPoolExecutor = None
+_default_process_pool_lock = Lock()
+
+
+def default_process_pool() -> ProcessPoolExecutor:
+    """Returns the shared `ProcessPoolExecutor` used by process pool providers
+    without an explicit pool. The pool is created on first use.
+    """
+    global _default_process_pool
+    if _default_process_pool is None:
+        with _default_process_pool_lock:
+            if _default_process_pool is None:
+                _default_process_pool = ProcessPoolExecutor()
+    return _default_process_pool
+
+
+class ProcessPoolFactory:
+    """Creates a value once by calling a factory in a process pool.
+
+    Arguments are resolved in the calling process and shipped to the pool
+    together with the factory so both must be picklable.
+
+    Calling the wrapper blocks until the value is ready. Call `start()` first to
+    submit the work without waiting. e.g. to build several values in parallel.
+    """
+
+    __slots__ = (
+        "_func",
+        "_args",
+        "_kwargs",
+        "_vals",
+        "_pool",
+        "_future",
+        "_lock",
+    )
+
+    _func: Callable
+    _args: "_PositionalArgs"
+    _kwargs: "_KeywordDeps"
+    _vals: Mapping
+    _pool: t.Optional["Executor"]
+    _future: "ConcurrentFuture"
+
+    def __new__(
+        cls,
+        func,
+        vals: Mapping = FrozenDict(),
+        args: "_PositionalArgs" = (),
+        kwargs: "_KeywordDeps" = FrozenDict(),
+        *,
+        pool: "Executor" = None,
+    ) -> Self:
+        self = _object_new(cls)
+        self._func = func
+        self._vals = vals
+        self._args = args
+        self._kwargs = kwargs
+        self._pool = pool
+        self._future = None
+        self._lock = Lock()
+        return self
+
+    def __repr__(self) -> str:
+        func = self._func
+        return f"{self.__class__.__name__}:{func.__module__}.{func.__qualname__}()"
+
+    def start(self) -> "ConcurrentFuture":
+        """Submit the factory to the pool if it was not submitted already.
+
+        Returns:
+            future (concurrent.futures.Future): the pending value.
+        """
+        if (future := self._future) is None:
+            with self._lock:
+                if (future := self._future) is None:
+                    pool = self._pool or default_process_pool()
+                    future = self._future = pool.submit(
+                        self._func, *self._args, **self._kwargs, **self._vals
+                    )
+        return future
+
+    def __call__(self):
+        return self.start().result()
+
+
+def _all_done(aws: Mapping[t.Any, t.Any]):
+    """Check whether all the given awaitables are successfully completed futures."""
+    if not aws:
+        return True
+    try:
+        for aw in aws.values():
+            if not aw.done() or aw.cancelled() or aw.exception():
+                return False
+    except AttributeError:
+        return False
+    return True
+
+
+def _ensure_futures(aws: Mapping[t.Any, t.Any], loop: AbstractEventLoop):
+    return {k: ensure_future(aw, loop=loop) for k, aw in aws.items()} if aws else aws
+
+
+if sys.version_info >= (3, 12):
+
+    def _create_task(aw, loop: AbstractEventLoop):
+        if iscoroutine(aw):
+            return Task(aw, loop=loop, eager_start=True)
+        return ensure_future(aw, loop=loop)
+
+else:  # pragma: no cover
+
+    def _create_task(aw, loop: AbstractEventLoop):
+        return ensure_future(aw, loop=loop)
+
+
 class FutureFactoryWrapper:
 
     __slots__ = (
@@ -331,6 +527,7 @@ class FutureFactoryWrapper:
         "_aw_args",
         "_aw_kwargs",
         "_aw_call",
+        "_eager",
     )
 
     _func: Callable
@@ -348,6 +545,7 @@ class FutureFactoryWrapper:
         aw_args: tuple[int] = FrozenDict(),
         aw_kwargs: tuple[str] = FrozenDict(),
         aw_call: bool = True,
+        eager: bool = True,
     ) -> Self:
         self = _object_new(cls)
         self._func = func
@@ -357,6 +555,7 @@ class FutureFactoryWrapper:
         self._aw_args = aw_args
         self._aw_kwargs = aw_kwargs
         self._aw_call = aw_call
+        self._eager = eager
         return self
 
     def __repr__(self) -> str:
@@ -366,11 +565,57 @@ class FutureFactoryWrapper:
         loop = get_running_loop()
         if aw_args := self._aw_args:
             _args = self._args
-            aw_args = {i: ensure_future(_args[i], loop=loop) for i in aw_args}
+            aw_args = {i: _args[i] for i in aw_args}
         if aw_kwargs := self._aw_kwargs:
-            aw_kwargs = {n: ensure_future(d(), loop=loop) for n, d in aw_kwargs}
+            aw_kwargs = {n: d() for n, d in aw_kwargs}
+
+        if self._eager and _all_done(aw_args) and _all_done(aw_kwargs):
+            return self._call_now(loop, aw_args, aw_kwargs)
+        return FactoryFuture(
+            self,
+            _ensure_futures(aw_args, loop),
+            _ensure_futures(aw_kwargs, loop),
+            loop=loop,
+        )
+
+    def _call_now(self, loop: AbstractEventLoop, aw_args, aw_kwargs, a=(), kw=None):
+        """Call the factory right away when all awaited dependencies are already
+        done (e.g. warm async singletons) instead of awaiting them in a
+        `FactoryFuture`. Returns a completed future unless the factory itself
+        is async.
+
+        Not used by singletons (`eager=False`) whose futures are cached since
+        a failed `FactoryFuture` is retried when awaited again.
+        """
+        _args = self._args
+        if aw_args:
+            args = [
+                aw_args[i].result() if i in aw_args else _args[i]
+                for i in range(len(_args))
+            ]
+        else:
+            args = _args
+        if aw_kwargs:
+            aw_kwargs = {n: aw.result() for n, aw in aw_kwargs.items()}
+        else:
+            aw_kwargs = _frozendict
+        if kw:
+            vals, kwargs = self._vals | kw, self._kwargs.skip(kw)
+        else:
+            vals, kwargs = self._vals, self._kwargs
+
+        try:
+            res = self._func(*args, *a, **aw_kwargs, **kwargs, **vals)
+        except Exception as e:
+            future = loop.create_future()
+            future.set_exception(e)
+            return future
 
-        return FactoryFuture(self, aw_args, aw_kwargs, loop=loop)
+        if self._aw_call:
+            return _create_task(res, loop)
+        future = loop.create_future()
+        future.set_result(res)
+        return future
 
 
 class FutureCallableWrapper(FutureFactoryWrapper):
@@ -381,13 +626,20 @@ class FutureCallableWrapper(FutureFactoryWrapper):
         loop = get_running_loop()
         if aw_args := self._aw_args:
             _args = self._args
-            aw_args = {i: ensure_future(_args[i], loop=loop) for i in aw_args}
+            aw_args = {i: _args[i] for i in aw_args}
         if aw_kwargs := self._aw_kwargs:
-            aw_kwargs = {
-                n: ensure_future(d(), loop=loop) for n, d in aw_kwargs if not n in kw
-            }
-
-        return CallableFuture(self, aw_args, aw_kwargs, args=a, kwargs=kw, loop=loop)
+            aw_kwargs = {n: d() for n, d in aw_kwargs if not n in kw}
+
+        if self._eager and _all_done(aw_args) and _all_done(aw_kwargs):
+            return self._call_now(loop, aw_args, aw_kwargs, a, kw)
+        return CallableFuture(
+            self,
+            _ensure_futures(aw_args, loop),
+            _ensure_futures(aw_kwargs, loop),
+            args=a,
+            kwargs=kw,
+            loop=loop,
+        )
 
 
 class FutureResourceWrapper(FutureFactoryWrapper):  # pragma: no cover
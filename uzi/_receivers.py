@@ -7,6 +7,11 @@ from .providers import (
     UnionProvider,
     DepMarkerProvider,
     LookupMarkerProvider,
+    ResolvedMarkerProvider,
+    LazyMarkerProvider,
+    ProviderOfMarkerProvider,
+    AllMarkerProvider,
+    KeyedMarkerProvider,
 )
 
 
@@ -17,6 +22,11 @@ def _register_implicit_providers(sender: type[Container], container: Container):
         DepMarkerProvider(),
         AnnotationProvider(),
         LookupMarkerProvider(),
+        ResolvedMarkerProvider(),
+        LazyMarkerProvider(),
+        ProviderOfMarkerProvider(),
+        AllMarkerProvider(),
+        KeyedMarkerProvider(),
     )
     for prov in provs:
         container[prov.abstract] = prov
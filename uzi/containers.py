@@ -1,4 +1,4 @@
-from abc import ABCMeta, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod
 import re
 import sys
 import typing as t
@@ -7,6 +7,7 @@ from collections import ChainMap, abc
 from typing_extensions import Self
 from weakref import WeakKeyDictionary
 from importlib import import_module
+from threading import RLock
 from .exceptions import ProError
 
 
@@ -23,9 +24,9 @@ from .markers import (
     is_injectable,
 )
 from ._common import ReadonlyDict, ordered_set, private_setattr, FrozenDict
-from .providers import Provider, ProviderRegistryMixin
+from .providers import Alias, Provider, ProviderRegistryMixin
 
-from .graph.core import Graph, DepKey, DepSrc
+from .graph.core import Graph, GraphCache, DepKey, DepSrc, invalidate_misses
 
 
 logger = getLogger(__name__)
@@ -34,6 +35,8 @@ _dict_setdefault = dict.setdefault
 _dict_setitem = dict.__setitem__
 _object_new = object.__new__
 
+_auto_bind_skip = frozenset((object, t.Generic, t.Protocol, ABC))
+
 
 def _calling_module(depth=2) -> t.Optional[str]:
     """Get the globals() or locals() scope of the calling scope"""
@@ -257,6 +260,8 @@ class BaseContainer(_PredicateOpsMixin, metaclass=ContainerMeta):
     __slots__ = ()
     is_atomic: bool = True
 
+    graph_cache_size: t.ClassVar[t.Optional[int]] = 128
+
     @classmethod
     @abstractmethod
     def _collect(cls, *a, **kw) -> "Group":
@@ -310,7 +315,7 @@ class BaseContainer(_PredicateOpsMixin, metaclass=ContainerMeta):
 
     @property
     @abstractmethod
-    def g(self) -> ReadonlyDict["Graph", "Graph"]:
+    def g(self) -> GraphCache:
         ...  # pragma: no cover
 
     @property
@@ -342,7 +347,7 @@ class BaseContainer(_PredicateOpsMixin, metaclass=ContainerMeta):
         try:
             return self.g[base]
         except KeyError:
-            return _dict_setdefault(self.g, base, self.create_graph(base))
+            return self.g.setdefault(base, self.create_graph(base))
 
     def create_graph(self, base: "Graph"):
         return Graph(self, base)
@@ -428,6 +433,10 @@ class Container(BaseContainer, ProviderRegistryMixin):
         bases (tuple[Container]): The container's bases
         default_access_modifier (AccessModifier): The default `access_modifier` to assign
         to providers registered in this container
+        graph_cache_size (int, None): The number of recently used graphs to keep
+        alive. `0` to only keep weak references and `None` to never evict graphs.
+        auto_bind (bool): Whether to bind unregistered base classes of registered
+        types to their implementation. See `Container.__init__()`.
     """
 
     __slots__ = (
@@ -436,17 +445,25 @@ class Container(BaseContainer, ProviderRegistryMixin):
         "providers",
         "bases",
         "default_access_modifier",
+        "auto_bind",
         "g",
         "_pro",
+        "_v_impls",
+        "_v_aliases",
+        "_v_lock",
         "__weakref__",
     )
 
     name: str
     bases: ProEntrySet
     default_access_modifier: AccessModifier
-    g: ReadonlyDict["Graph", "Graph"]
+    g: GraphCache
     providers: ReadonlyDict[Injectable, Provider]
+    auto_bind: bool
     _pro: FrozenDict[Self, int]
+    _v_impls: dict[type, dict[type, None]]
+    _v_aliases: dict[type, Alias]
+    _v_lock: RLock
     is_atomic: t.Final = True
 
     def __init__(
@@ -455,6 +472,7 @@ class Container(BaseContainer, ProviderRegistryMixin):
         *bases: Self,
         module: str,
         access_modifier: AccessModifier = PUBLIC,
+        auto_bind: bool = False,
     ) -> None:
         """Create a container.
 
@@ -463,6 +481,10 @@ class Container(BaseContainer, ProviderRegistryMixin):
             *bases (Container, optional): Base container.
             access_modifier (AccessModifier, optional): The default `access_modifier`
                 to assign providers
+            auto_bind (bool, optional): Whether to bind unregistered base classes
+                (e.g. ABCs) of registered types to their implementation. A base
+                class is only bound if it has a single registered implementation
+                in this container. Defaults to False.
         """
         if name and not name.isidentifier():
             raise ValueError(f"name must be a valid identifier not {name!r}")
@@ -473,8 +495,12 @@ class Container(BaseContainer, ProviderRegistryMixin):
             name=name or f"__anonymous__",
             providers=ReadonlyDict(),
             module=module,
-            g=ReadonlyDict(),
+            g=GraphCache(self.graph_cache_size),
             default_access_modifier=AccessModifier(access_modifier),
+            auto_bind=auto_bind,
+            _v_impls={},
+            _v_aliases={},
+            _v_lock=RLock(),
         )
 
         bases and self.extend(*bases)
@@ -519,7 +545,22 @@ class Container(BaseContainer, ProviderRegistryMixin):
         return Group(*a, **kw)
 
     def _on_register(self, abstract: Injectable, provider: Provider):
-        pass
+        if self.auto_bind and isinstance(abstract, type):
+            impls, aliases = self._v_impls, self._v_aliases
+            for base in abstract.__mro__[1:]:
+                if not base in _auto_bind_skip:
+                    impls.setdefault(base, {})[abstract] = None
+                    aliases.pop(base, None)
+
+    def _auto_bound(self, abstract: Injectable) -> t.Optional[Alias]:
+        try:
+            return self._v_aliases[abstract]
+        except KeyError:
+            with self._v_lock:
+                impls = self._v_impls.get(abstract)
+                if impls and len(impls) == 1:
+                    pro = Alias(*impls)._setup(self, abstract)
+                    return self._v_aliases.setdefault(abstract, pro)
 
     def __contains__(self, x):
         return x in self.providers or any(x in b for b in self.bases)
@@ -529,6 +570,9 @@ class Container(BaseContainer, ProviderRegistryMixin):
 
             container[_T] = providers.Value('abc')
 
+        Registration is serialized by the container's lock so concurrent
+        registrations can't lose entries or leave auto bound aliases stale.
+
         Params:
             abstract (Injectable): The dependency to be provided
             provider (Provider): The provider to provide the dependency
@@ -538,10 +582,13 @@ class Container(BaseContainer, ProviderRegistryMixin):
                 f"expected `Injectable` not. `{key.__class__.__qualname__}`"
             )
 
-        if prov := provider._setup(self, key):
-            self._on_register(key, prov)
-            _dict_setitem(self.providers, key, prov)
-            # self.__setitem(key, prov)
+        with self._v_lock:
+            if prov := provider._setup(self, key):
+                self._on_register(key, prov)
+                _dict_setitem(self.providers, key, prov)
+                invalidate_misses()
+                # self.__setitem(key, prov)
+        if prov:
             signals.on_provider_registered.send(self, abstract=key, provider=provider)
 
     def __getitem__(self, k):
@@ -550,6 +597,8 @@ class Container(BaseContainer, ProviderRegistryMixin):
         except KeyError:
             if isinstance(k, Provider) and (k.container or self) is self:
                 return k
+            elif self.auto_bind:
+                return self._auto_bound(k)
 
     def _resolve(self, key: "DepKey", graph: "Graph"):
         if prov := self[key.abstract]:
@@ -612,7 +661,7 @@ class Group(BaseContainer):
         try:
             return self._g
         except AttributeError:
-            self.__setattr(_g=ReadonlyDict())
+            self.__setattr(_g=GraphCache(self.graph_cache_size))
             return self._g
 
     @property
@@ -1,21 +1,26 @@
 import typing as t
-from collections import abc
+from collections import Counter, OrderedDict, abc
+from itertools import count
 from contextvars import ContextVar
 from logging import getLogger
+from threading import Event, Lock, get_ident
+from weakref import WeakKeyDictionary, WeakValueDictionary, ref
 
+import attr
 from typing_extensions import Self
 
 from .. import Injectable
 from .._common import FrozenDict, Missing, ReadonlyDict, private_setattr
 from ..exceptions import FinalProviderOverrideError, ProError
 from ..markers import (
+    DependencyMarker,
     ProNoopPredicate,
     ProPredicate,
     _noop_pred,
     is_dependency_marker,
     is_injectable,
 )
-from .nodes import MissingNode, _T_Node
+from .nodes import MissingNode, Node, _T_Node
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from ..containers import Container
@@ -37,6 +42,52 @@ class DepSrc(t.NamedTuple):
     predicate: ProPredicate = _noop_pred
 
 
+class _WeakDepSrc(DepSrc):
+    """A `DepSrc` holding it's container by weak reference. Used in keys passed
+    to parent graphs. See `Graph._parent_accessor()`.
+    """
+
+    __slots__ = ()
+
+    @property
+    def container(self) -> "Container":
+        return self[1]()
+
+    @property
+    def container_ref(self) -> "_ContainerRef":
+        return self[1]
+
+
+class _ContainerRef(ref):
+    __slots__ = ()
+
+
+_container_refs: "WeakKeyDictionary[Container, _ContainerRef]" = WeakKeyDictionary()
+_collected_epochs = count(1)
+_collected_epoch = 0
+
+
+def _container_collected(r: _ContainerRef):
+    global _collected_epoch
+    _collected_epoch = next(_collected_epochs)
+
+
+def _container_ref(container: "Container") -> _ContainerRef:
+    """Returns the shared weak reference to the given container."""
+    try:
+        return _container_refs[container]
+    except KeyError:
+        return _container_refs.setdefault(
+            container, _ContainerRef(container, _container_collected)
+        )
+
+
+def _get_origin(abstract: Injectable):
+    if isinstance(abstract, DependencyMarker):
+        return abstract.__origin__
+    return t.get_origin(abstract)
+
+
 @private_setattr
 class DepKey:
 
@@ -50,6 +101,7 @@ class DepKey:
     src: DepSrc
 
     graph: "Graph" = None
+    _srcs: dict[DepSrc, DepSrc] = None
 
     def __init_subclass__(cls, scope=None) -> None:
         cls.graph = scope
@@ -61,9 +113,12 @@ class DepKey:
         container: "Container" = None,
         predicate: ProPredicate = ProNoopPredicate(),
     ) -> Self:
-        self, src = _object_new(cls), DepSrc(
+        srccls = _WeakDepSrc if container.__class__ is _ContainerRef else DepSrc
+        self, src = _object_new(cls), srccls(
             cls.graph, container, predicate or _noop_pred
         )
+        if not (srcs := cls._srcs) is None:
+            src = srcs.setdefault(src, src)
         self.__setattr(abstract=abstract, src=src, _ash=hash((abstract, src)))
         return self
 
@@ -84,7 +139,7 @@ class DepKey:
     ):
         return self.__class__(
             abstract or self.abstract,
-            container or self.container,
+            container or self.src[1],
             predicate or self.predicate,
         )
 
@@ -148,22 +203,45 @@ class Graph(ReadonlyDict[_T_BindKey, _T_Node]):
 
     """
 
-    __slots__ = "container", "parent", "pros", "stack", "keyclass"
+    __slots__ = (
+        "container",
+        "parent",
+        "pros",
+        "stack",
+        "keyclass",
+        "hoisted",
+        "_v_misses",
+        "_v_misses_epoch",
+        "_v_stats",
+        "_v_flights",
+        "_v_weak",
+        "_v_weak_epoch",
+        "__weakref__",
+    )
 
     container: "Container"
     parent: Self
     pros: ProPaths
     stack: "ResolutionStack"
     keyclass: type[DepKey]
+    hoisted: "WeakValueDictionary[tuple, Node]"
 
     __contains = dict.__contains__
     __setdefault = dict.setdefault
+    __pop = dict.pop
 
     def __init__(self, container: "Container", parent: "Graph" = None):
         self.__setattr(
             container=container,
             parent=_null_graph if parent is None else parent,
-            keyclass=type(f"BindKey", (DepKey,), {"graph": self}),
+            keyclass=type(f"BindKey", (DepKey,), {"graph": self, "_srcs": {}}),
+            hoisted=WeakValueDictionary(),
+            _v_misses={},
+            _v_misses_epoch=_misses_epoch,
+            _v_stats=Counter(),
+            _v_flights={},
+            _v_weak={},
+            _v_weak_epoch=_collected_epoch,
         )
         self.__setattr(
             pros=ProPaths(self),
@@ -199,6 +277,47 @@ class Graph(ReadonlyDict[_T_BindKey, _T_Node]):
     def extends(self, graph: Self):
         return graph is self or self.parent.extends(graph)
 
+    def owns(self, node: Node) -> bool:
+        """Check whether the given node was resolved by this graph.
+
+        This includes nodes that were resolved by this graph but hoisted into
+        it's `parent` to be shared with sibling graphs.
+        """
+        return node.graph is self or (
+            node.graph is self.parent and node.container in self.pros.pro
+        )
+
+    def hoist(self, node: _T_Node) -> _T_Node:
+        """Share a node with all sibling graphs.
+
+        Non-shared nodes (e.g. factories) whose dependencies all live in the
+        `parent` graph resolve identically in every graph extending the same
+        parent. Such nodes are moved into the parent graph and reused by all
+        its children instead of being duplicated per child graph.
+
+        Only nodes of providers from extended (i.e. shared) containers are
+        hoisted. Nodes of providers local to this graph's container can't be
+        shared with siblings. Hoisted nodes are held weakly by the `parent` and
+        live only as long as the graphs using them.
+
+        Returns the node to use. i.e. the hoisted node or the given node if it
+        cannot be hoisted.
+        """
+        if node.is_shared or not (parent := self.parent) or not node.graph is self:
+            return node
+        elif node.container is self.container:
+            return node
+
+        deps = tuple(node.dependencies)
+        if any(d.graph is self for d in deps):
+            return node
+
+        key = node.__class__, node.abstract, node.provider, *deps
+        try:
+            return parent.hoisted[key]
+        except KeyError:
+            return parent.hoisted.setdefault(key, attr.evolve(node, graph=parent))
+
     def make_key(
         self,
         abstract: Injectable,
@@ -213,59 +332,188 @@ class Graph(ReadonlyDict[_T_BindKey, _T_Node]):
             )
 
     def find_provider(self, dep: DepKey):
-        rv = [p for c in self.pros[dep.src] for p in c._resolve(dep, self)]
-        if rv:
+        if rv := self.find_providers(dep):
             if len(rv) > 1:
-                rv.sort(key=lambda p: int(not not p.is_default))
                 if final := next((p for p in rv if p.is_final), None):
                     if overrides := rv[: rv.index(final)]:
                         raise FinalProviderOverrideError(dep, final, overrides)
             return rv[0]
 
+    def find_providers(self, dep: DepKey) -> list["Provider"]:
+        """Returns all providers of the given dependency in this graph ordered by
+        precedence. Providers in `parent` graphs are not included.
+        """
+        rv = [p for c in self.pros[dep.src] for p in c._resolve(dep, self)]
+        if len(rv) > 1:
+            rv.sort(key=lambda p: int(not not p.is_default))
+        return rv
+
+    def get_node(self, abstract: _T_BindKey, default=None):
+        """Returns the node for the given dependency or `default` if it cannot
+        be resolved.
+
+        Unlike `graph[abstract]`, misses for the given `abstract` are cached
+        as is. i.e. without creating a `DepKey` so that probing for optional
+        dependencies is cheap.
+
+        Args:
+            abstract (Injectable): the dependency.
+            default (Any, optional): returned if the dependency is missing.
+                Defaults to None.
+        """
+        if node := self.get(abstract):
+            return node
+        elif abstract in self._check_misses():
+            return default
+        elif node := self[abstract]:
+            return node
+        self._v_misses[abstract] = _missing_node(abstract)
+        return default
+
+    def resolution_info(self):
+        """Report the resolution statistics of this graph.
+
+        Returns:
+            ResolutionInfo: resolved, missed, miss_hits, invalidated and currsize.
+        """
+        misses, stats = self._check_misses(), self._v_stats
+        return ResolutionInfo(
+            stats["resolved"],
+            stats["missed"],
+            stats["miss_hits"],
+            stats["invalidated"],
+            len(misses),
+        )
+
+    def _check_misses(self):
+        if not self._v_misses_epoch == _misses_epoch:
+            self._v_stats["invalidated"] += len(self._v_misses)
+            self._v_misses.clear()
+            self.__setattr(_v_misses_epoch=_misses_epoch)
+        return self._v_misses
+
     def resolve(self, dep_: _T_BindKey, *, recursive: bool = True):
         if not (bind := self.get(dep_, Missing)) is Missing:
-            if recursive or not bind or self is bind.graph:
+            if recursive or not bind or self.owns(bind):
                 return bind
         elif dep_ != (dep := self.make_key(dep_)):
             bind = self.resolve(dep)
             if dep in self:
                 bind = self.__setdefault(dep_, bind)
-            if recursive or not bind or self is bind.graph:
+            if recursive or not bind or self.owns(bind):
                 return bind
-        elif is_injectable(dep.abstract):
-            abstract = dep.abstract
-
-            if prov := self.find_provider(dep):
-
-                if prov.container and not prov.container is dep.container:
-                    return self.__setdefault(
-                        dep, self[self.make_key(abstract, prov.container)]
-                    )
-
+        elif not is_injectable(dep.abstract):
+            raise TypeError(
+                f"expected an `Injectable` not `{dep.abstract.__class__.__qualname__}`"
+            )
+        elif not recursive:
+            return self._resolve(dep, recursive=False)
+        elif dep in (misses := self._check_misses()):
+            self._v_stats["miss_hits"] += 1
+            return misses[dep]
+        elif (flight := self._v_flights.setdefault(dep, new := _Flight())) is new:
+            try:
+                if (bind := self.get(dep, Missing)) is Missing:
+                    bind = self._resolve(dep)
+                flight.result = bind
+                return bind
+            finally:
+                del self._v_flights[dep]
+                flight.done()
+        elif (bind := flight.wait()) is Missing:
+            return self._resolve(dep)
+        else:
+            return bind
+
+    def _resolve(self, dep: DepKey, *, recursive: bool = True):
+        abstract = dep.abstract
+        if self._v_weak and not self._v_weak_epoch == _collected_epoch:
+            self._sweep()
+        if dep.src.__class__ is _WeakDepSrc:
+            self._track(dep)
+        if prov := self.find_provider(dep):
+            if prov.container and not prov.container is dep.container:
+                return self.__setdefault(
+                    dep, self[self.make_key(abstract, prov.container)]
+                )
+            elif bind := self._provide(dep, prov):
+                return bind
+        elif (origin := _get_origin(abstract)) and (
+            prov := self.find_provider(odep := dep.replace(abstract=origin))
+        ):
+            if prov.is_template or is_dependency_marker(origin):
                 with self.stack.push(prov, abstract):
                     if bind := prov._resolve(abstract, self):
-                        return self.__setdefault(dep, bind)
-            elif origin := t.get_origin(abstract):
-                if is_dependency_marker(origin):
-                    if prov := self.find_provider(
-                        dep.replace(abstract=t.get_origin(abstract))
-                    ):
-                        with self.stack.push(prov, abstract):
-                            if bind := prov._resolve(abstract, self):
-                                return self.__setdefault(dep, bind)
-                elif bind := self.resolve(
-                    dep.replace(abstract=origin), recursive=False
-                ):
-                    return self.__setdefault(dep, bind)
-
-            if recursive and ((bind := self.parent[dep]) or dep in self.parent):
+                        return self.__setdefault(dep, self.hoist(bind))
+            elif bind := self._provide_origin(odep, prov):
                 return self.__setdefault(dep, bind)
-        else:
-            raise TypeError(
-                f"expected an `Injectable` not `{dep.abstract.__class__.__qualname__}`"
+
+        if recursive:
+            if (pdep := dep).predicate is _noop_pred and self.parent:
+                pdep = self.parent.make_key(abstract, self._parent_accessor(dep))
+            if (bind := self.parent[pdep]) or pdep in self.parent:
+                return self.__setdefault(dep, bind)
+            self._v_stats["missed"] += 1
+            return self._v_misses.setdefault(dep, _missing_node(abstract))
+
+    def _provide(self, dep: DepKey, prov: "Provider"):
+        with self.stack.push(prov, dep.abstract):
+            if bind := prov._resolve(dep.abstract, self):
+                return self.__setdefault(dep, self.hoist(bind))
+
+    def _provide_origin(self, odep: DepKey, prov: "Provider"):
+        """Resolve the generic origin `odep` of a dependency with it's already
+        found provider `prov`. Same as `resolve(odep, recursive=False)` but
+        without looking up the provider again.
+        """
+        if not (bind := self.get(odep, Missing)) is Missing:
+            return bind if not bind or self.owns(bind) else None
+        elif odep.src.__class__ is _WeakDepSrc:
+            self._track(odep)
+
+        if prov.container and not prov.container is odep.container:
+            return self.__setdefault(
+                odep, self[self.make_key(odep.abstract, prov.container)]
             )
+        return self._provide(odep, prov)
+
+    def _parent_accessor(self, dep: DepKey):
+        """Returns the container to use in keys passed to the `parent` graph.
 
-    __missing__ = resolve
+        Keys are re-created for the parent so that it's caches don't keep this
+        graph alive. Containers local to this graph are passed by weak reference
+        for the same reason. The parent drops it's entries for a container once
+        the container is collected. See `_track()`.
+        """
+        if (src := dep.src).__class__ is _WeakDepSrc:
+            return src.container_ref
+        elif (container := src.container) in self.pros.pro:
+            return _container_ref(container)
+        return container
+
+    def _track(self, dep: DepKey):
+        """Record an entry for a weakly referenced container to be dropped
+        once the container is collected.
+        """
+        try:
+            self._v_weak[dep.src.container_ref].add(dep)
+        except KeyError:
+            self._v_weak.setdefault(dep.src.container_ref, set()).add(dep)
+
+    def _sweep(self):
+        self.__setattr(_v_weak_epoch=_collected_epoch)
+        weak, misses, srcs = self._v_weak, self._v_misses, self.keyclass._srcs
+        for r in [r for r in weak if r() is None]:
+            for dep in weak.pop(r, ()):
+                self.__pop(dep, None)
+                misses.pop(dep, None)
+                dict.pop(self.pros, dep.src, None)
+                srcs.pop(dep.src, None)
+
+    def __missing__(self, key: _T_BindKey):
+        if bind := self.resolve(key):
+            self._v_stats["resolved"] += 1
+        return bind
 
     def __eq__(self, o) -> bool:
         if isinstance(o, Graph):
@@ -281,6 +529,21 @@ class Graph(ReadonlyDict[_T_BindKey, _T_Node]):
         return id(self)
 
 
+_misses_epochs = count(1)
+_misses_epoch = 0
+
+
+def invalidate_misses():
+    """Invalidate the misses cached by `Graph.resolve()` and `Graph.get_node()`
+    in all graphs.
+
+    Called whenever a provider is registered. Each call sets a new, unique epoch
+    (`next()` is atomic) so concurrent calls can't cancel each other out.
+    """
+    global _misses_epoch
+    _misses_epoch = next(_misses_epochs)
+
+
 class NullGraph(Graph):
     """A 'noop' `Graph` used as the parent of root scopes.
 
@@ -318,11 +581,14 @@ class NullGraph(Graph):
     def __contains__(self, key):
         return False
 
+    def get_node(self, abstract, default=None):
+        return default
+
     def __getitem__(self, key):
         if is_injectable(key):
-            return MissingNode(key, self)
+            return _missing_node(key)
         elif isinstance(key, DepKey) and is_injectable(key.abstract):
-            return MissingNode(key.abstract, self)
+            return _missing_node(key.abstract)
         else:
             raise TypeError(
                 f"Graph keys must be `Injectable` not `{key.__class__.__qualname__}`"
@@ -340,10 +606,205 @@ class NullGraph(Graph):
 _null_graph = NullGraph()
 
 
+_missing_nodes: WeakValueDictionary[Injectable, MissingNode] = WeakValueDictionary()
+
+
+def _missing_node(abstract: Injectable) -> MissingNode:
+    """Returns the interned `MissingNode` for the given abstract."""
+    try:
+        return _missing_nodes[abstract]
+    except KeyError:
+        return _missing_nodes.setdefault(abstract, MissingNode(abstract, _null_graph))
+
+
+_waiting: dict[int, "_Flight"] = {}
+
+
+class _Flight:
+    """An in-flight resolution of a dependency.
+
+    The first thread to resolve a given dependency builds it while the others
+    wait for its result. A thread won't wait if doing so would deadlock. i.e.
+    if the flight is owned by the thread itself (a recursive lookup) or by a
+    thread that is (indirectly) waiting for it. It builds the node itself
+    instead.
+    """
+
+    __slots__ = ("owner", "result", "_event")
+
+    def __init__(self) -> None:
+        self.owner = get_ident()
+        self.result = Missing
+        self._event = Event()
+
+    def done(self):
+        self._event.set()
+
+    def wait(self):
+        """Wait for the flight to land and return its result or `Missing`
+        if it failed or waiting would deadlock.
+        """
+        ident = get_ident()
+        _waiting[ident] = self
+        try:
+            flight, seen = self, set()
+            while flight and not flight.owner in seen:
+                if flight.owner == ident:
+                    return Missing
+                seen.add(flight.owner)
+                flight = _waiting.get(flight.owner)
+            self._event.wait()
+            return self.result
+        finally:
+            del _waiting[ident]
+
+
+class ResolutionInfo(t.NamedTuple):
+    """Resolution statistics of a `Graph`.
+
+    Attributes:
+        resolved (int): number of dependencies resolved by the graph.
+        missed (int): number of dependencies that could not be resolved.
+        miss_hits (int): number of lookups answered by the negative cache.
+        invalidated (int): number of cached misses dropped after a provider
+            was registered.
+        currsize (int): number of cached misses.
+
+    The counters are not synchronized and may be approximate when resolving
+    from several threads.
+    """
+
+    resolved: int
+    missed: int
+    miss_hits: int
+    invalidated: int
+    currsize: int
+
+
+class GraphCacheInfo(t.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: t.Optional[int]
+    currsize: int
+
+
+@private_setattr
+class GraphCache(abc.Mapping["Graph", "Graph"]):
+    """A container's cache of graphs keyed by their parent graph.
+
+    Graphs are held by weak reference. i.e. a graph is dropped from the cache
+    once it's no longer used elsewhere (e.g. by a `Scope`). Since a graph
+    references it's parent, the parent graph (key) is released along with it.
+
+    Up to `maxsize` of the most recently used graphs are also held by strong
+    reference so that graphs of short-lived scopes can be reused. Set `maxsize`
+    to `0` to only hold weak references or `None` to never evict graphs.
+
+    Attributes:
+        maxsize (int, None): the maximum number of graphs to keep alive.
+        hits (int): number of successful lookups.
+        misses (int): number of failed lookups.
+        evictions (int): number of graphs dropped from the strong cache.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "hits",
+        "misses",
+        "evictions",
+        "__refs",
+        "__lru",
+        "__lock",
+    )
+
+    maxsize: t.Optional[int]
+    hits: int
+    misses: int
+    evictions: int
+
+    __refs: WeakValueDictionary["Graph", "Graph"]
+    __lru: OrderedDict["Graph", "Graph"]
+    __lock: Lock
+
+    def __init__(self, maxsize: t.Optional[int] = 128) -> None:
+        if not (maxsize is None or maxsize >= 0):
+            raise ValueError(
+                f"maxsize must be a positive `int` or `None` not {maxsize!r}"
+            )
+        self.__refs = WeakValueDictionary()
+        self.__lru = OrderedDict()
+        self.__lock = Lock()
+        self.__setattr(maxsize=maxsize, hits=0, misses=0, evictions=0)
+
+    def info(self):
+        """Report cache statistics.
+
+        Returns:
+            GraphCacheInfo: hits, misses, evictions, maxsize and currsize.
+        """
+        return GraphCacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self)
+        )
+
+    def setdefault(self, parent: "Graph", graph: "Graph"):
+        with self.__lock:
+            graph = self.__refs.setdefault(parent, graph)
+            self.__touch(parent, graph)
+            return graph
+
+    def clear(self):
+        """Drop all strong references and reset the statistics."""
+        with self.__lock:
+            self.__lru.clear()
+            self.__setattr(hits=0, misses=0, evictions=0)
+
+    def __touch(self, parent: "Graph", graph: "Graph"):
+        maxsize, lru = self.maxsize, self.__lru
+        if maxsize is None:
+            lru[parent] = graph
+        elif maxsize > 0:
+            lru[parent] = graph
+            lru.move_to_end(parent)
+            if len(lru) > maxsize:
+                lru.popitem(last=False)
+                self.__setattr(evictions=self.evictions + 1)
+
+    def __getitem__(self, parent: "Graph"):
+        with self.__lock:
+            try:
+                graph = self.__refs[parent]
+            except KeyError:
+                self.__setattr(misses=self.misses + 1)
+                raise
+            else:
+                self.__setattr(hits=self.hits + 1)
+                self.maxsize and self.__touch(parent, graph)
+                return graph
+
+    def __contains__(self, parent) -> bool:
+        return parent in self.__refs
+
+    def __len__(self) -> int:
+        return len(self.__refs)
+
+    def __iter__(self):
+        return iter(list(self.__refs))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.info()})"
+
+
 @private_setattr
 class ResolutionStack(abc.Sequence):
+    """The stack of providers being resolved in the current context.
 
-    __slots__ = ("__var",)
+    Only pushed items are stored in the context. The bottom item (the graph's
+    container) is kept on the stack itself so that contexts in which a graph was
+    used (e.g. the main thread's) don't keep it's container alive.
+    """
+
+    __slots__ = ("__var", "__base")
 
     class StackItem(t.NamedTuple):
         container: "Container"
@@ -351,17 +812,20 @@ class ResolutionStack(abc.Sequence):
         provider: "Provider" = None
 
     __var: ContextVar[tuple[StackItem]]
+    __base: tuple[StackItem]
 
     def __init__(self, default: "Container"):
-        stack = (self.StackItem(default),)
-        self.__var = ContextVar(
-            f"{default.name}.{self.__class__.__name__}", default=stack
-        )
-        self.__var.set(stack)
+        self.__base = (self.StackItem(default),)
+        self.__var = ContextVar(f"{default.name}.{self.__class__.__name__}")
+
+    def __stack(self):
+        return self.__var.get(()) + self.__base
 
     @property
     def top(self):
-        return self[0]
+        if stack := self.__var.get(()):
+            return stack[0]
+        return self.__base[0]
 
     def push(self, provider: "Provider", abstract: Injectable = None):
         top = self.top
@@ -370,19 +834,18 @@ class ResolutionStack(abc.Sequence):
             abstract or provider.abstract or top.abstract,
             provider,
         )
-        self.__var.set((new,) + self[:])
+        self.__var.set((new,) + self.__var.get(()))
         return self
 
     def pop(self):
         var = self.__var
-        stack = var.get()
-        if len(stack) < 2:
+        if not (stack := var.get(())):
             raise ValueError(f"too many calls to pop()")
         var.set(stack[1:])
         return stack[0]
 
     def index(self, val, start=0, stop=None):
-        stack = self.__var.get()[start:stop:]
+        stack = self.__stack()[start:stop:]
 
         if isinstance(val, tuple):
             return stack.index(val)
@@ -393,26 +856,26 @@ class ResolutionStack(abc.Sequence):
         raise ValueError(val)
 
     def __reversed__(self):
-        yield from reversed(self.__var.get())
+        yield from reversed(self.__stack())
 
     def __contains__(self, k):
-        stack = self.__var.get()
+        stack = self.__stack()
         if isinstance(k, tuple):
             return k in stack
         else:
             return any(k in x for x in stack)
 
     def __getitem__(self, k):
-        return self.__var.get()[k]
+        return self.__stack()[k]
 
     def __bool__(self):
         return True
 
     def __len__(self):
-        return len(self.__var.get())
+        return len(self.__stack())
 
     def __iter__(self):
-        return iter(self.__var.get())
+        return iter(self.__stack())
 
     def __enter__(self):
         return self
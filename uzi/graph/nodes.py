@@ -1,13 +1,16 @@
 from abc import ABC, abstractmethod
 import logging
-from threading import Lock
+from functools import cache
+from asyncio import ensure_future, isfuture
+from inspect import isawaitable, iscoroutine
+from threading import Lock, local
 from typing_extensions import Self
 import attr
 import typing as t
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 
-from .._common import Missing, private_setattr
+from .._common import FrozenDict, Missing, private_setattr
 from .._functools import (
     BoundParams,
     _PositionalArgs,
@@ -16,12 +19,14 @@ from .._functools import (
     FutureFactoryWrapper,
     FutureResourceWrapper,
     FutureCallableWrapper,
+    ProcessPoolFactory,
 )
 
 from ..markers import T_Injectable, T_Injected
-from ..exceptions import InjectorLookupError
+from ..exceptions import InjectorLookupError, InvalidStateError
 
 if t.TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
     from ..providers import Provider
     from ..injectors import Injector
     from ..containers import Container
@@ -53,20 +58,19 @@ class Node(ABC, t.Generic[_T_Concrete]):
     concrete: _T_Concrete = attr.ib(kw_only=True, default=Missing, repr=True)
 
     is_async: bool = False
+    is_shared: bool = True
     dependencies = frozenset[Self]()
 
-    _v_ident: tuple = attr.ib(init=False, repr=False)
-
-    @_v_ident.default
-    def _init_v_ident(self):
-        return self.abstract, self.graph, self.container
-
-    _ash: tuple = attr.ib(init=False, repr=False)
+    _ash: int = attr.ib(init=False, repr=False)
 
     @_ash.default
     def _init_ash(self):
         return hash(self._v_ident)
 
+    @property
+    def _v_ident(self):
+        return self.abstract, self.graph, self.container
+
     @property
     def container(self):
         if pro := self.provider or self.graph:
@@ -100,6 +104,7 @@ class MissingNode:
     __slots__ = (
         "abstract",
         "graph",
+        "__weakref__",
     )
 
     graph: "Graph"
@@ -161,13 +166,41 @@ _T_ValueNode = t.TypeVar("_T_ValueNode", bound=Value, covariant=True)
 """Value node `TypeVar`"""
 
 
+class _Resolution(local):
+    memo: t.Optional[dict] = None
+
+
+_resolution = _Resolution()
+"""The current thread's resolution. `memo` holds the values of
+`ResolutionScoped` nodes created during the current top-level resolution.
+"""
+
+
+def _resolution_root(func: Callable[..., T_Injected]) -> Callable[..., T_Injected]:
+    """Wraps `func` to start a new resolution unless one is already active."""
+
+    def resolve(*a, **kw):
+        if _resolution.memo is not None:
+            return func(*a, **kw)
+
+        _resolution.memo = {}
+        try:
+            return func(*a, **kw)
+        finally:
+            _resolution.memo = None
+
+    return resolve
+
+
 @attr.s(slots=True, frozen=True, cmp=False)
 class Factory(Node[T_Injected]):
     """Factory node"""
 
+    is_shared: bool = False
+
     concrete: T_Injected = attr.ib(kw_only=True)
     params: "BoundParams" = attr.ib(kw_only=True, default=BoundParams.make(()))
-    thread_safe: bool = attr.ib(kw_only=True, default=False)
+    thread_safe: bool = attr.ib(kw_only=True, default=True)
 
     @property
     def dependencies(self):
@@ -210,6 +243,77 @@ _T_FactoryNode = t.TypeVar("_T_FactoryNode", bound=Factory, covariant=True)
 """Factory node `TypeVar`"""
 
 
+@attr.s(slots=True, frozen=True, cmp=False)
+class ResolutionScoped(Factory[T_Injected]):
+    """ResolutionScoped node. Shares the value within a single (top-level)
+    resolution.
+    """
+
+    def bind(self, injector: "Injector"):
+        func = super().bind(injector)
+
+        def factory():
+            if (memo := _resolution.memo) is None:
+                return func()
+            elif (value := memo.get(factory, Missing)) is Missing:
+                value = memo[factory] = func()
+            return value
+
+        return factory
+
+
+class _ResolutionRoot:
+    """Base class of nodes that start a new resolution (if none is active) when
+    called. i.e. nodes that depend on `ResolutionScoped` nodes.
+    """
+
+    __slots__ = ()
+
+
+class _ResolutionRootBind(_ResolutionRoot):
+    __slots__ = ()
+
+    def bind(self, injector: "Injector"):
+        return _resolution_root(super().bind(injector))
+
+
+class _ResolutionRootFactory(_ResolutionRoot):
+    """For nodes that create values using `factory()`. e.g. `Singleton`,
+    `Partial` and `Callable`.
+    """
+
+    __slots__ = ()
+
+    def factory(self, injector: "Injector"):
+        return _resolution_root(super().factory(injector))
+
+
+def in_resolution_scope(params: BoundParams) -> bool:
+    """Check whether any of the given `params` depends on a `ResolutionScoped`
+    node. i.e. directly or via other nodes.
+    """
+    return any(
+        isinstance(d, (ResolutionScoped, _ResolutionRoot)) for d in params.dependencies
+    )
+
+
+@cache
+def resolution_root(cls: type[_T_FactoryNode]) -> type[_T_FactoryNode]:
+    """Returns a subclass of the given node type that starts a new resolution
+    when called.
+
+    Raises:
+        TypeError: if `cls` is async.
+    """
+    if cls.is_async:
+        raise TypeError(
+            f"async `{cls.__name__}` nodes cannot depend on `ResolutionScoped` "
+            f"dependencies."
+        )
+    base = _ResolutionRootFactory if hasattr(cls, "factory") else _ResolutionRootBind
+    return type(cls.__name__, (base, cls), {"__slots__": (), "__module__": __name__})
+
+
 @attr.s(slots=True, frozen=True, cmp=False)
 class AsyncFactory(Factory[T_Injected]):
     """AsyncFactory node"""
@@ -260,6 +364,8 @@ class AwaitParamsAsyncFactory(AwaitParamsFactory[T_Injected]):
 class Singleton(Factory[T_Injected]):
     """Singleton node"""
 
+    is_shared: bool = True
+
     # aw_enter: bool = attr.ib(kw_only=True, default=False)
 
     def factory(self, injector: "Injector"):
@@ -297,6 +403,22 @@ _T_SingletonNode = t.TypeVar("_T_SingletonNode", bound=Singleton, covariant=True
 """Singleton node `TypeVar`"""
 
 
+@attr.s(slots=True, frozen=True, cmp=False)
+class ProcessSingleton(Singleton[T_Injected]):
+    """Singleton node whose value is created in a process pool."""
+
+    pool: "Executor" = attr.ib(kw_only=True, default=None)
+
+    def bind(self, injector: "Injector"):
+        return ProcessPoolFactory(
+            self.concrete,
+            self.params.vals,
+            args=self.resolve_args(injector),
+            kwargs=self.resolve_kwargs(injector),
+            pool=self.pool,
+        )
+
+
 @attr.s(slots=True, frozen=True, cmp=False)
 class AsyncSingleton(Singleton[T_Injected]):
     """AsyncSingleton node"""
@@ -313,10 +435,11 @@ class AsyncSingleton(Singleton[T_Injected]):
                 args=args,
                 kwargs=kwargs,
                 aw_call=self.async_call,
+                eager=False,
             )
         else:
             return FutureFactoryWrapper(
-                self.concrete, self.params.vals, aw_call=self.async_call
+                self.concrete, self.params.vals, aw_call=self.async_call, eager=False
             )
 
 
@@ -339,6 +462,7 @@ class AwaitParamsSingleton(Singleton[T_Injected], AwaitParamsFactory[T_Injected]
             aw_args=aw_args,
             aw_kwargs=aw_kwargs,
             aw_call=self.async_call,
+            eager=False,
         )
 
 
@@ -349,9 +473,235 @@ class AwaitParamsAsyncSingleton(AwaitParamsSingleton[T_Injected]):
     async_call: bool = True
 
 
+def resolved_value(func: Callable[[], t.Any], abstract: T_Injectable = None):
+    """Returns the value of an async dependency synchronously.
+
+    Args:
+        func (Callable): the bound callable of the async dependency.
+        abstract (Injectable, optional): the dependency. Used in errors.
+
+    Raises:
+        InvalidStateError: if the dependency is not resolved yet.
+    """
+    try:
+        aw = func()
+    except RuntimeError as e:  # no running event loop
+        raise InvalidStateError(f"`{abstract}` is not resolved yet.") from e
+
+    if isfuture(aw):
+        if aw.done():
+            return aw.result()
+    elif iscoroutine(aw):
+        aw.close()
+    raise InvalidStateError(f"`{abstract}` is not resolved yet.")
+
+
+@attr.s(slots=True, frozen=True, cmp=False)
+class Resolved(Node[T_Injected]):
+    """Resolved node. Provides the resolved value of an async singleton
+    synchronously.
+    """
+
+    concrete: Singleton = attr.ib(kw_only=True)
+
+    @property
+    def dependencies(self):
+        return frozenset((self.concrete,))
+
+    def bind(self, injector: "Injector"):
+        func, abstract = injector[self.concrete], self.abstract
+        value = Missing
+
+        def resolved():
+            nonlocal value
+            if value is Missing:
+                value = resolved_value(func, abstract)
+            return value
+
+        return resolved
+
+
+@attr.s(slots=True, frozen=True, cmp=False)
+class Lazy(Node[T_Injected]):
+    """Lazy node. Provides a callable that resolves the `concrete` node on first
+    call.
+
+    For async nodes, the callable returns a future of the value so that it can be
+    awaited more than once.
+    """
+
+    @property
+    def dependencies(self):
+        return frozenset((self.concrete,))
+
+    def bind(self, injector: "Injector"):
+        node = self.concrete
+
+        def lazy():
+            value = Missing
+
+            def thunk():
+                nonlocal value
+                if value is Missing:
+                    if isawaitable(value := injector[node]()):
+                        value = ensure_future(value)
+                return value
+
+            return thunk
+
+        return lazy
+
+
+@attr.s(slots=True, frozen=True, cmp=False)
+class ProviderOf(Node[T_Injected]):
+    """ProviderOf node. Provides the callable bound to the `concrete` node."""
+
+    @property
+    def dependencies(self):
+        return frozenset((self.concrete,))
+
+    def bind(self, injector: "Injector"):
+        func = injector[self.concrete]
+        return lambda: func
+
+
+@attr.s(slots=True, frozen=True, cmp=False)
+class All(Node[tuple[T_Injected]]):
+    """All node. Provides a tuple with the values of the given `items`."""
+
+    items: tuple[Node] = attr.ib(kw_only=True, default=(), converter=tuple)
+
+    @property
+    def is_async(self):
+        return any(n.is_async for n in self.items)
+
+    @property
+    def dependencies(self):
+        return frozenset(self.items)
+
+    def bind(self, injector: "Injector"):
+        funcs = tuple(injector[n] for n in self.items)
+        if all(n.__class__ is Value for n in self.items):
+            vals = tuple(f() for f in funcs)
+            return lambda: vals
+        elif not self.is_async:
+            return lambda: tuple([f() for f in funcs])
+
+        async def resolve():
+            vals = [f() for f in funcs]
+            return tuple([await v if isawaitable(v) else v for v in vals])
+
+        return resolve
+
+
+class KeyedValues(Mapping[t.Any, T_Injected]):
+    """A read-only mapping of keys to values injected for `Keyed[T]`. Values are
+    created on access.
+    """
+
+    __slots__ = ("_nodes", "_injector")
+
+    def __init__(self, nodes: Mapping[t.Any, Node], injector: "Injector"):
+        self._nodes, self._injector = nodes, injector
+
+    def __getitem__(self, key) -> T_Injected:
+        return self._injector[self._nodes[key]]()
+
+    def __contains__(self, key) -> bool:
+        return key in self._nodes
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._nodes)})"
+
+
+@attr.s(slots=True, frozen=True, cmp=False)
+class Keyed(Node[KeyedValues[T_Injected]]):
+    """Keyed node. Provides a `KeyedValues` mapping of the given `items`."""
+
+    items: FrozenDict[t.Any, Node] = attr.ib(
+        kw_only=True, factory=FrozenDict, converter=FrozenDict
+    )
+
+    @property
+    def dependencies(self):
+        return frozenset(self.items.values())
+
+    def bind(self, injector: "Injector"):
+        values = KeyedValues(self.items, injector)
+        return lambda: values
+
+
+def enter_resource(value, on_close: Callable):
+    """Enter the given resource and register it's teardown with `on_close`.
+
+    Context managers are entered and their `__exit__` registered. Otherwise, the
+    resource's `aclose()` or `close()` method (if any) is registered.
+
+    Returns:
+        the entered value.
+    """
+    cls = value.__class__
+    if hasattr(cls, "__enter__") and hasattr(cls, "__exit__"):
+        rv = cls.__enter__(value)
+        on_close(cls.__exit__, value, None, None, None)
+        return rv
+    elif close := getattr(value, "aclose", None) or getattr(value, "close", None):
+        on_close(close)
+    return value
+
+
+async def aenter_resource(aw: t.Awaitable, on_close: Callable):
+    """Await the given resource and enter it. Async context managers are
+    entered and their `__aexit__` registered. See `enter_resource()`.
+    """
+    value = await aw
+    cls = value.__class__
+    if hasattr(cls, "__aenter__") and hasattr(cls, "__aexit__"):
+        rv = await cls.__aenter__(value)
+        on_close(cls.__aexit__, value, None, None, None)
+        return rv
+    return enter_resource(value, on_close)
+
+
 @attr.s(slots=True, frozen=True, cmp=False)
 class Resource(Singleton[T_Injected]):
-    """Binds resources."""
+    """Binds resources.
+
+    Injectors with teardown support (i.e. ones with an `on_close()` method like
+    `AsyncInjector`) enter the resource when it is created and tear it down when
+    closed. See `enter_resource()`. Other injectors use the value as is.
+    """
+
+    def factory(self, injector: "Injector"):
+        func = super().factory(injector)
+        if not (on_close := getattr(injector, "on_close", None)):
+            return func
+        elif self.is_async:
+            return lambda: ensure_future(aenter_resource(func(), on_close))
+        return lambda: enter_resource(func(), on_close)
+
+
+@attr.s(slots=True, frozen=True, cmp=False)
+class AsyncResource(Resource[T_Injected], AsyncSingleton[T_Injected]):
+    """AsyncResource node"""
+
+
+@attr.s(slots=True, frozen=True, cmp=False)
+class AwaitParamsResource(Resource[T_Injected], AwaitParamsSingleton[T_Injected]):
+    """AwaitParamsResource node"""
+
+
+@attr.s(slots=True, frozen=True, cmp=False)
+class AwaitParamsAsyncResource(
+    Resource[T_Injected], AwaitParamsAsyncSingleton[T_Injected]
+):
+    """AwaitParamsAsyncResource node"""
 
 
 _T_ResourceNode = t.TypeVar("_T_ResourceNode", bound=Resource, covariant=True)
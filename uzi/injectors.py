@@ -1,15 +1,18 @@
+import asyncio
 import logging
 import sys
 import typing as t
 from collections.abc import Callable
+from functools import partial
+from inspect import isawaitable, iscoroutine
 from types import MethodType
 
 from typing_extensions import Self
 
 
 from . import providers
-from .markers import Injectable, T_Injectable, T_Injected
-from .exceptions import InjectorLookupError
+from .markers import Injectable, Resolved, T_Injectable, T_Injected
+from .exceptions import InjectorLookupError, InvalidStateError
 from ._common import ReadonlyDict, private_setattr
 from .graph.nodes import Node
 
@@ -28,6 +31,10 @@ _object_new = object.__new__
 TContextNode = Callable[["Injector", t.Optional[Injectable]], Callable[..., T_Injected]]
 
 
+async def _await(aw: t.Awaitable[_T]) -> _T:
+    return await aw
+
+
 @private_setattr
 class Injector(ReadonlyDict[T_Injectable, Callable[[], T_Injected]]):
     """An isolated dependency injection context for a given `Scope`.
@@ -39,6 +46,7 @@ class Injector(ReadonlyDict[T_Injectable, Callable[[], T_Injected]]):
     Params:
         graph (DepGraph): the dependency graph for this injector
         parent (Injector): a parent injector to provide missing dependencies.
+        binds (Mapping, optional): prebound callables keyed by their nodes.
 
     """
 
@@ -51,8 +59,14 @@ class Injector(ReadonlyDict[T_Injectable, Callable[[], T_Injected]]):
     graph: "Graph"
     parent: Self
 
-    def __init__(self, graph: "Graph", parent: Self):
+    def __init__(
+        self,
+        graph: "Graph",
+        parent: Self,
+        binds: t.Mapping[Node, Callable[[], T_Injected]] = (),
+    ):
         self.__setattr(graph=graph, parent=parent)
+        binds and dict.update(self, binds)
 
     @property
     def name(self) -> str:
@@ -62,6 +76,64 @@ class Injector(ReadonlyDict[T_Injectable, Callable[[], T_Injected]]):
     def bound(self, abstract: T_Injectable) -> T_Injected:
         return self[self.graph[abstract]]
 
+    def get(self, abstract: T_Injectable, default=None):
+        """Returns the bound callable for the given dependency or `default` if
+        the dependency cannot be resolved.
+
+        Unlike `bound()`, a missing dependency is not an error. Misses are
+        cached by the graph. See `Graph.get_node()`.
+
+        Args:
+            abstract (Injectable): the dependency.
+            default (Any, optional): returned if the dependency is missing.
+                Defaults to None.
+        """
+        if node := self.graph.get_node(abstract):
+            return self[node]
+        return default
+
+    def warmup(self, *abstracts: T_Injectable) -> tuple[T_Injected]:
+        """Create the given dependencies. Those created in a process pool (see
+        `Singleton.in_process()`) are all submitted before waiting for any of
+        them so that they are created in parallel.
+
+        Returns:
+            values (tuple): the created values in the given order.
+        """
+        funcs = tuple(self.bound(abstract) for abstract in abstracts)
+        for func in funcs:
+            if start := getattr(func, "start", None):
+                start()
+        return tuple(func() for func in funcs)
+
+    async def awarmup(self, *abstracts: T_Injectable) -> tuple[T_Injected]:
+        """Concurrently resolve the given (async) dependencies. Once resolved,
+        async singletons can be used synchronously. See `result()`.
+
+        Returns:
+            values (tuple): the resolved values in the given order.
+        """
+        vals = [self.bound(abstract)() for abstract in abstracts]
+        aws = {i: v for i, v in enumerate(vals) if isawaitable(v)}
+        # `FactoryFuture`s only complete when awaited, so they can't be passed
+        # to `gather()` directly.
+        res = await asyncio.gather(*map(_await, aws.values()))
+        for i, v in zip(aws, res):
+            vals[i] = v
+        return tuple(vals)
+
+    def result(self, abstract: T_Injectable) -> T_Injected:
+        """Returns the value of the given dependency synchronously.
+
+        Async dependencies (e.g. async singletons) must already be resolved.
+        See `awarmup()` and `uzi.markers.Resolved`.
+
+        Raises:
+            InvalidStateError: if the async dependency is not resolved yet.
+            TypeError: if the dependency is async but not a singleton.
+        """
+        return self.bound(Resolved(abstract))()
+
     def make(self, abstract: T_Injectable, /, *args, **kwds) -> T_Injected:
         graph = self.graph
         if dep := graph[abstract]:
@@ -84,6 +156,8 @@ class Injector(ReadonlyDict[T_Injectable, Callable[[], T_Injected]]):
         return self.__contains(x) or x in self.parent
 
     def __missing__(self, dep: Node):
+        # When several threads bind the same node, `setdefault` ensures they
+        # all get the first bound callable.
         try:
             return self.__setdefault(
                 dep, (dep.graph is self.graph and dep.bind(self)) or self.parent[dep]
@@ -99,6 +173,10 @@ class Injector(ReadonlyDict[T_Injectable, Callable[[], T_Injected]]):
     def close(self):
         ...  # pragma: no cover
 
+    async def aclose(self):
+        """Close the injector awaiting it's async teardown (if any)."""
+        self.close()
+
     def copy(self):
         return self
 
@@ -123,6 +201,83 @@ class Injector(ReadonlyDict[T_Injectable, Callable[[], T_Injected]]):
         return not x is self if isinstance(x, Injector) else NotImplemented
 
 
+class AsyncInjector(Injector):
+    """An `Injector` with async teardown.
+
+    Callbacks registered via `on_close()` are called when the injector is
+    closed. `aclose()` awaits the awaitables they return concurrently.
+    """
+
+    __slots__ = ("_close_callbacks",)
+
+    _close_callbacks: list[Callable[[], t.Any]]
+
+    def __init__(self, graph: "Graph", parent: Self, binds=()):
+        super().__init__(graph, parent, binds)
+        self.__setattr(_close_callbacks=[])
+
+    def on_close(self, callback: "_T_Fn", /, *args, **kwds) -> "_T_Fn":
+        """Register a callback to call when the injector is closed. Callbacks
+        are called in the reverse order of registration.
+
+        Returns:
+            callback (Callable): the given callback.
+        """
+        self._close_callbacks.append(
+            partial(callback, *args, **kwds) if args or kwds else callback
+        )
+        return callback
+
+    def _run_close_callbacks(self) -> tuple[list[t.Awaitable], list[Exception]]:
+        callbacks, aws, errors = self._close_callbacks[::-1], [], []
+        self._close_callbacks.clear()
+        for callback in callbacks:
+            try:
+                rv = callback()
+            except Exception as e:
+                errors.append(e)
+            else:
+                isawaitable(rv) and aws.append(rv)
+        return aws, errors
+
+    def close(self):
+        """Close the injector without waiting for async teardown. Awaitables
+        returned by the callbacks are scheduled on the running event loop.
+
+        Raises:
+            InvalidStateError: if callbacks returned awaitables outside a running
+                event loop. Their coroutines are closed without being awaited.
+                Use `aclose()` instead.
+        """
+        aws, errors = self._run_close_callbacks()
+        if aws:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                for aw in aws:
+                    iscoroutine(aw) and aw.close()
+                raise InvalidStateError(
+                    f"{self!r} has async teardown but no event loop is running. "
+                    "Use `await injector.aclose()` instead of `close()`."
+                ) from (errors[0] if errors else None)
+            for aw in aws:
+                asyncio.ensure_future(aw, loop=loop)
+        if errors:
+            raise errors[0]
+
+    async def aclose(self):
+        """Close the injector and concurrently await the awaitables returned by
+        the callbacks. The first error raised (if any) is re-raised after all
+        callbacks are done.
+        """
+        aws, errors = self._run_close_callbacks()
+        if aws:
+            for rv in await asyncio.gather(*aws, return_exceptions=True):
+                isinstance(rv, Exception) and errors.append(rv)
+        if errors:
+            raise errors[0]
+
+
 class NullInjector(Injector):
     """A 'noop' `Injector` used as the parent of root injectors.
 
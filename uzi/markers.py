@@ -1,10 +1,10 @@
-from functools import reduce, wraps
+from functools import lru_cache, reduce, wraps
 from inspect import Parameter, signature
 from logging import getLogger
 import operator
 from types import FunctionType, GenericAlias, MethodType
 import typing as t
-from abc import ABC, ABCMeta, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod, get_cache_token
 from collections import abc
 from enum import Enum
 
@@ -62,6 +62,108 @@ _BLACKLIST = frozenset(
 )
 
 
+class InjectableKind(Enum):
+    """The kind of an object as far as injection is concerned.
+
+    Attributes:
+        non_injectable (InjectableKind): cannot be injected.
+        injectable (InjectableKind): a plain injectable. e.g. a `type`
+        marker (InjectableKind): a `DependencyMarker`
+        union (InjectableKind): a `Union` or `Optional`
+        annotated (InjectableKind): an `Annotated` type
+    """
+
+    non_injectable: "InjectableKind" = 0
+    injectable: "InjectableKind" = 1
+    marker: "InjectableKind" = 2
+    union: "InjectableKind" = 3
+    annotated: "InjectableKind" = 4
+
+    @property
+    def is_injectable(self) -> bool:
+        return self.value > 0
+
+    @property
+    def is_marker(self) -> bool:
+        return self.value > 1
+
+
+_non_injectable = InjectableKind.non_injectable
+_injectable = InjectableKind.injectable
+
+_typing_modules = frozenset({"typing", "types", "typing_extensions"})
+
+_kinds_by_type: dict[type, InjectableKind] = {}
+_kinds_token = get_cache_token()
+
+
+@lru_cache(maxsize=1024)
+def _kinds_by_value(cls: type, obj) -> InjectableKind:
+    return _eval_injectable_kind(obj)
+
+
+def injectable_kind(obj) -> InjectableKind:
+    """Classify the given object. See `InjectableKind`.
+
+    Results are cached by the object's type. Objects from the `typing` and
+    `types` modules (e.g. `Union[A, B]`, `list[A]`) are cached by value since
+    their kind depends on their arguments. The value cache is a bounded LRU
+    since such objects are often created on the fly. The caches are cleared
+    whenever an `ABC` gets a new virtual subclass.
+
+    Params:
+        obj (Any): The object to classify.
+    Returns:
+        (InjectableKind): the kind.
+    """
+    global _kinds_token
+    if not (token := get_cache_token()) == _kinds_token:
+        _kinds_by_type.clear()
+        _kinds_by_value.cache_clear()
+        _kinds_token = token
+
+    cls = obj.__class__
+    try:
+        kind = _kinds_by_type[cls]
+    except KeyError:
+        kind = _kinds_by_type.setdefault(cls, _eval_injectable_type_kind(obj))
+
+    if kind is None:
+        # `Union[A, B] == A | B` so the type is part of the key
+        try:
+            return _kinds_by_value(cls, obj)
+        except TypeError:
+            return _eval_injectable_kind(obj)
+    elif kind is _non_injectable or not cls in _special_types:
+        return kind
+    return _special_kinds.get(obj, kind)
+
+
+def _eval_injectable_type_kind(obj) -> t.Optional[InjectableKind]:
+    if obj.__class__.__module__ in _typing_modules:
+        return None
+    elif not isinstance(obj, Injectable) or isinstance(obj, NonInjectable):
+        return InjectableKind.non_injectable
+    elif isinstance(obj, (DependencyMarker, DependencyMarkerType)):
+        return InjectableKind.marker
+    return InjectableKind.injectable
+
+
+def _eval_injectable_kind(obj) -> InjectableKind:
+    if not isinstance(obj, Injectable) or isinstance(obj, NonInjectable):
+        return InjectableKind.non_injectable
+    elif not (kind := _special_kinds.get(obj)) is None:
+        return kind
+    elif _is_dependency_marker(obj):
+        origin = t.get_origin(obj)
+        if origin is t.Union:
+            return InjectableKind.union
+        elif origin is t.Annotated:
+            return InjectableKind.annotated
+        return InjectableKind.marker
+    return InjectableKind.injectable
+
+
 def is_injectable(obj):
     """Returns `True` if the given type annotation is injectable.
 
@@ -70,9 +172,7 @@ def is_injectable(obj):
     Returns:
         (bool): `True` if `typ` can be injected or `False` if otherwise.
     """
-    return isinstance(obj, Injectable) and not (
-        obj in _BLACKLIST or isinstance(obj, NonInjectable)
-    )
+    return not injectable_kind(obj) is _non_injectable
 
 
 def is_injectable_annotation(typ):
@@ -83,7 +183,7 @@ def is_injectable_annotation(typ):
     Returns:
         (bool): `True` if `typ` can be injected or `False` if otherwise.
     """
-    return is_injectable(typ)
+    return not injectable_kind(typ) is _non_injectable
 
 
 class Injectable(metaclass=ABCMeta):
@@ -122,6 +222,16 @@ __static_makers = {
     t.Annotated,
 }
 
+_special_kinds: dict[t.Any, InjectableKind] = dict.fromkeys(
+    _BLACKLIST, InjectableKind.non_injectable
+) | {
+    t.Union: InjectableKind.union,
+    t.Annotated: InjectableKind.annotated,
+}
+
+# only objects of these types need to be looked up in `_special_kinds`
+_special_types = frozenset(map(type, _special_kinds))
+
 
 @t.overload
 def is_dependency_marker(obj: "DependencyMarker") -> True:
@@ -141,10 +251,21 @@ def is_dependency_marker(obj: t.Any, ind=0) -> bool:
     Returns:
         bool:
     """
+    try:
+        kind = injectable_kind(obj)
+    except TypeError:
+        return _is_dependency_marker(obj)
+    return not (kind is _non_injectable or kind is _injectable)
+
+
+def _is_dependency_marker(obj: t.Any) -> bool:
     return (
         isinstance(obj, (DependencyMarker, DependencyMarkerType))
         or obj in __static_makers
-        or (not not (orig := t.get_origin(obj)) and is_dependency_marker(orig))
+        or (
+            not (orig := t.get_origin(obj)) in (None, obj)
+            and _is_dependency_marker(orig)
+        )
     )
 
 
@@ -712,6 +833,137 @@ class Dep(PureDep):
         )
 
 
+@private_setattr
+class Resolved(PureDep):
+    """Marks an async dependency to be injected synchronously using its
+    resolved value.
+
+    Allows sync factories to depend on async singletons that are resolved
+    before they are used (e.g. during startup). Injecting an unresolved
+    dependency raises an `InvalidStateError`. Other async dependencies (e.g.
+    async factories) are rejected with a `TypeError`.
+
+    Params:
+        abstract (T_Injectable): the async dependency.
+    """
+
+    __slots__ = ()
+
+
+@private_setattr
+class Lazy(PureDep):
+    """Marks a dependency to be injected lazily.
+
+    Injects a zero-arg callable that resolves the dependency on first call and
+    returns the same value on subsequent calls. Useful for expensive
+    dependencies that are only used some of the time.
+
+        def handler(db: Lazy[Database]):
+            if ...:
+                db().query(...)
+
+    Params:
+        abstract (T_Injectable): the dependency.
+    """
+
+    __slots__ = ()
+
+    def __class_getitem__(cls, abstract: T_Injectable) -> Self:
+        return cls(abstract)
+
+
+@private_setattr
+class ProviderOf(PureDep):
+    """Marks a dependency whose bound factory is to be injected.
+
+    Injects the zero-arg callable bound to the dependency in the injector.
+    Each call resolves the dependency without any lookups. Useful for creating
+    many instances of a transient dependency.
+
+        def process(items: list, make: ProviderOf[Processor]):
+            for item in items:
+                make().process(item)
+
+    Params:
+        abstract (T_Injectable): the dependency.
+    """
+
+    __slots__ = ()
+
+    def __class_getitem__(cls, abstract: T_Injectable) -> Self:
+        return cls(abstract)
+
+
+@private_setattr
+class All(PureDep):
+    """Marks a dependency whose providers are all to be injected.
+
+    Injects a tuple with values from every provider of the dependency. i.e.
+    including those overridden by other providers. Values are ordered by
+    precedence with values provided in parent scopes last. Missing
+    dependencies inject an empty tuple.
+
+        def dispatch(event: Event, handlers: All[Handler]):
+            for handler in handlers:
+                handler(event)
+
+    Params:
+        abstract (T_Injectable): the dependency.
+    """
+
+    __slots__ = ()
+
+    def __class_getitem__(cls, abstract: T_Injectable) -> Self:
+        return cls(abstract)
+
+
+@private_setattr
+class Keyed(PureDep):
+    """Marks a dependency registered under a given `key`.
+
+    Providers registered as `Keyed(T, key)` in any container can be injected
+    individually using the same marker or all together using `Keyed[T]` (i.e.
+    without a key) as a read-only mapping of keys to values. Values are created
+    on access.
+
+        container.factory(Keyed(Command, "start"), StartCommand)
+        container.factory(Keyed(Command, "stop"), StopCommand)
+
+        def dispatch(name: str, commands: Keyed[Command]):
+            return commands[name].run()
+
+    Params:
+        abstract (T_Injectable): the dependency.
+        key (Hashable, optional): the key.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls: type[Self], abstract: T_Injectable, key=Missing) -> Self:
+        self = _object_new(cls)
+        self.__setattr(_ident=(abstract, key))
+        return self
+
+    @property
+    def abstract(self) -> T_Injectable:
+        return self._ident[0]
+
+    @property
+    def key(self):
+        return self._ident[1]
+
+    def __class_getitem__(cls, abstract: T_Injectable) -> Self:
+        return cls(abstract)
+
+    def __reduce__(self):
+        return self.__class__, self._ident
+
+    def __repr__(self) -> str:
+        if self.key is Missing:
+            return f"{self.__class__.__name__}[{self.abstract!s}]"
+        return f"{self.__class__.__name__}({self.abstract!s}, {self.key!r})"
+
+
 class Lookup(DependencyMarker, BaseLookup):
     """Represents a lazy lookup of a given dependency.
 
@@ -2,10 +2,13 @@ import sys
 import typing as t
 from abc import ABC, abstractmethod
 from collections import abc
+from concurrent.futures import Executor
 from functools import wraps
-from inspect import Parameter, Signature, iscoroutinefunction
+from inspect import Parameter, Signature, isasyncgenfunction, iscoroutinefunction
 from logging import getLogger
+from threading import RLock
 from types import FunctionType, GenericAlias
+from weakref import WeakValueDictionary
 
 import attr
 from typing_extensions import Self
@@ -16,9 +19,10 @@ from ._common import lookups
 
 from .graph import nodes
 from ._common import Missing, FrozenDict, private_setattr, typed_signature
-from ._functools import BoundParams
+from ._functools import BoundParams, ExecutorWrapper
 from .markers import Injectable, T_Injectable, T_Injected, is_injectable
 from .markers import (
+    All,
     GUARDED,
     PRIVATE,
     PROTECTED,
@@ -26,8 +30,12 @@ from .markers import (
     AccessModifier,
     Dep,
     DependencyMarker,
+    Keyed,
     Lookup,
+    Lazy,
+    ProviderOf,
     PureDep,
+    Resolved,
 )
 
 if sys.version_info < (3, 10):  # pragma: py-gt-39
@@ -49,6 +57,8 @@ logger = getLogger(__name__)
 _T = t.TypeVar("_T")
 _T_Fn = t.TypeVar("_T_Fn", bound=abc.Callable, covariant=True)
 
+_freeze_lock = RLock()
+
 
 def _fluent_decorator(fn=None, default=Missing, *, fluent: bool = False):
     def decorator(func: _T_Fn) -> _T_Fn:
@@ -109,6 +119,7 @@ class Provider(t.Generic[_T_Concrete, _T_Node]):
     is_final: bool = attr.ib(kw_only=True, default=False)
 
     is_async: bool = attr.ib(init=False, default=None)
+    is_template: t.ClassVar[bool] = False
 
     filters: tuple[abc.Callable[["Graph", Injectable], bool]] = attr.ib(
         kw_only=True, default=(), converter=tuple
@@ -319,8 +330,10 @@ class Provider(t.Generic[_T_Concrete, _T_Node]):
 
     def _freeze(self):
         if not self._frozen:
-            self._onfreeze()
-            self.__setattr(_frozen=True)
+            with _freeze_lock:
+                if not self._frozen:
+                    self._onfreeze()
+                    self.__setattr(_frozen=True)
 
     def _onfreeze(self):
         ...  # pragma: no cover
@@ -430,9 +443,14 @@ class Factory(
     """
 
     arguments: tuple[tuple, FrozenDict] = attr.ib(default=((), FrozenDict()))
+    executor: t.Optional[Executor] = attr.ib(init=False, default=Missing)
     # is_shared: t.ClassVar[bool] = False
 
     _signature: Signature = attr.ib(init=False, default=None)
+    _v_signature: Signature = attr.ib(init=False, default=None, cmp=False, repr=False)
+    _v_params: WeakValueDictionary = attr.ib(
+        init=False, factory=WeakValueDictionary, cmp=False, repr=False
+    )
 
     _blank_signature: t.ClassVar[Signature] = Signature()
     _arbitrary_signature: t.ClassVar[Signature] = Signature(
@@ -443,7 +461,7 @@ class Factory(
     )
 
     _sync_node_type: t.ClassVar = nodes.Factory
-    _asyns_node_type: t.ClassVar = nodes.AsyncFactory
+    _async_node_type: t.ClassVar = nodes.AsyncFactory
     _await_params_sync_node_type: t.ClassVar = nodes.AwaitParamsFactory
     _await_params_async_node_type: t.ClassVar = nodes.AwaitParamsAsyncFactory
 
@@ -471,6 +489,25 @@ class Factory(
         self.__setattr(is_async=is_async)
         return self
 
+    def in_executor(self, executor: t.Optional[Executor] = None) -> Self:
+        """Run the factory in an `Executor`. Updates the `executor` attribute.
+
+        Useful for factories that block (e.g. on I/O). The provider becomes
+        asynchronous and the factory is called via the running event loop's
+        `run_in_executor()`. Dependants await the result like they would for
+        any other `async` dependency.
+
+        Args:
+            executor (Union[Executor, None], optional): The executor to use.
+                `None` to use the event loop's default executor or `Missing`
+                to call the factory directly. Defaults to `None`.
+
+        Returns:
+            self (Provider): this provider
+        """
+        self.__setattr(executor=executor)
+        return self
+
     def args(self, *args) -> Self:
         """Set the positional arguments to pass to the factory.
 
@@ -545,10 +582,16 @@ class Factory(
     def get_signature(self, dep: Injectable = None):
         sig = self._signature
         if sig is None:
+            if not (sig := self._v_signature) is None:
+                return sig
             try:
-                return typed_signature(self.concrete)
+                sig = typed_signature(self.concrete)
             except ValueError:
                 return self._fallback_signature()
+            else:
+                # Share the evaluated signature (and it's `Parameter` objects)
+                # between all graphs once the provider can no longer change.
+                self._frozen and self.__setattr("_v_signature", sig, True)
         return sig
 
     def _fallback_signature(self):
@@ -559,31 +602,46 @@ class Factory(
             self.__setattr(is_async=self._is_async_factory())
 
     def _is_async_factory(self) -> bool:
-        return iscoroutinefunction(self.concrete)
+        return not self.executor is Missing or iscoroutinefunction(self.concrete)
 
     def _bind_params(
         self, scope: "Graph", abstract: Injectable, *, sig=None, arguments=()
     ):
         sig = sig or self.get_signature(abstract)
         args, kwargs = arguments or self.arguments
-        return BoundParams.bind(sig, scope, self.container, args, kwargs)
+        return BoundParams.bind(
+            sig,
+            scope,
+            self.container,
+            args,
+            kwargs,
+            cache=self._v_params if self._frozen else None,
+            key=abstract,
+        )
 
     def _node_kwargs(self, **kwds):
-        kwds.setdefault("concrete", self.concrete)
+        if self.executor is Missing:
+            kwds.setdefault("concrete", self.concrete)
+        else:
+            kwds.setdefault("concrete", ExecutorWrapper(self.concrete, self.executor))
         return super()._node_kwargs(**kwds)
 
-    def _make_node(self, abstract: T_Injectable, scope: "Graph", **kwds):
-        params = self._bind_params(scope, abstract)
+    def _get_node_type(self, params: BoundParams) -> type[_T_Node]:
         if params.is_async:
             if self.is_async:
-                cls = self._await_params_async_node_type
+                return self._await_params_async_node_type
             else:
-                cls = self._await_params_sync_node_type
+                return self._await_params_sync_node_type
         elif self.is_async:
-            cls = self._asyns_node_type
+            return self._async_node_type
         else:
-            cls = self._sync_node_type
+            return self._sync_node_type
 
+    def _make_node(self, abstract: T_Injectable, scope: "Graph", **kwds):
+        params = self._bind_params(scope, abstract)
+        cls = self._get_node_type(params)
+        if nodes.in_resolution_scope(params):
+            cls = nodes.resolution_root(cls)
         return cls(
             abstract,
             scope,
@@ -593,6 +651,24 @@ class Factory(
         )
 
 
+@attr.s(slots=True, cmp=True, init=False)
+class ResolutionScoped(Factory[T_Injected, nodes._T_FactoryNode]):
+    """A `ResolutionScoped` provider is a `Factory` whose instance is shared
+    within a single resolution.
+
+    The instance is created at most once while resolving a given (top-level)
+    dependency and is injected wherever it's required in that object graph.
+    Subsequent resolutions create new instances.
+
+    Async factories are not supported. They behave like a normal `Factory`.
+    Async dependants (e.g. async factories or factories with async
+    dependencies) cannot depend on `ResolutionScoped` providers and raise a
+    `TypeError` when resolved.
+    """
+
+    _sync_node_type: t.ClassVar = nodes.ResolutionScoped
+
+
 @attr.s(slots=True, cmp=True, init=False)
 class Singleton(Factory[T_Injected, nodes._T_SingletonNode]):
     """A `Singleton` provider is a `Factory` that returns same instance on every
@@ -604,16 +680,21 @@ class Singleton(Factory[T_Injected, nodes._T_SingletonNode]):
     Attributes:
         is_thread_safe (bool): Indicates whether to wrap the factory call with a
             `Lock` to prevent simultaneous instance create when injecting from
-            multiple threads. Defaults to None
+            multiple threads. Defaults to None (i.e. thread safe). The lock is
+            only acquired until the instance is created.
+        process_pool (Union[Executor, None]): The process pool used to create the
+            instance. See `in_process()`. Defaults to `Missing`
     """
 
     is_shared: t.ClassVar[bool] = True
     is_thread_safe: bool = attr.ib(init=False, default=None)
+    process_pool: t.Optional[Executor] = attr.ib(init=False, default=Missing)
 
     _sync_node_type: t.ClassVar = nodes.Singleton
     _async_node_type: t.ClassVar = nodes.AsyncSingleton
     _await_params_sync_node_type: t.ClassVar = nodes.AwaitParamsSingleton
     _await_params_async_node_type: t.ClassVar = nodes.AwaitParamsAsyncSingleton
+    _process_node_type: t.ClassVar = nodes.ProcessSingleton
 
     def thread_safe(self, is_thread_safe: bool = True) -> Self:
         """_Mark/Unmark_ this provider as thread safe. Updates the `is_thread_safe`
@@ -632,10 +713,50 @@ class Singleton(Factory[T_Injected, nodes._T_SingletonNode]):
         self.__setattr(is_thread_safe=is_thread_safe)
         return self
 
+    def in_process(self, pool: t.Optional[Executor] = None) -> Self:
+        """Create the instance in a process pool. Updates the `process_pool`
+        attribute.
+
+        Useful for CPU-heavy values. The factory and it's arguments are sent to
+        the pool and the created instance shipped back so all must be picklable.
+        Use `Injector.warmup()` to create several such values in parallel.
+
+        Args:
+            pool (Union[Executor, None], optional): The pool to use. `None` to use
+                a shared `ProcessPoolExecutor` or `Missing` to create the
+                instance in the current process. Defaults to `None`.
+
+        Returns:
+            self (Provider): this provider
+        """
+        self.__setattr(process_pool=pool)
+        return self
+
     def _node_kwargs(self, **kwds):
-        kwds.setdefault("thread_safe", self.is_thread_safe)
+        if not self.is_thread_safe is None:
+            kwds.setdefault("thread_safe", self.is_thread_safe)
         return super()._node_kwargs(**kwds)
 
+    def _make_node(self, abstract: T_Injectable, scope: "Graph", **kwds):
+        if self.process_pool is Missing:
+            return super()._make_node(abstract, scope, **kwds)
+
+        params = self._bind_params(scope, abstract)
+        if self.is_async or params.is_async:
+            raise TypeError(
+                f"`{self}` cannot be created in a process pool: async providers "
+                f"and providers with async dependencies are not supported."
+            )
+
+        return self._process_node_type(
+            abstract,
+            scope,
+            self,
+            params=params,
+            pool=self.process_pool,
+            **self._node_kwargs(**kwds),
+        )
+
 
 @attr.s(slots=True, cmp=True, init=False)
 class Resource(Singleton[T_Injected, nodes._T_ResourceNode]):
@@ -648,15 +769,100 @@ class Resource(Singleton[T_Injected, nodes._T_ResourceNode]):
     is_awaitable: bool = attr.ib(init=False, default=None)
     is_shared: t.ClassVar[bool] = True
 
+    _sync_node_type: t.ClassVar = nodes.Resource
+    _async_node_type: t.ClassVar = nodes.AsyncResource
+    _await_params_sync_node_type: t.ClassVar = nodes.AwaitParamsResource
+    _await_params_async_node_type: t.ClassVar = nodes.AwaitParamsAsyncResource
+
     def awaitable(self, is_awaitable=True):
         self.__setattr(is_awaitable=is_awaitable)
         return self
 
+    def _is_async_factory(self) -> bool:
+        return super()._is_async_factory() or _is_async_cm_factory(self.concrete)
+
     def _node_kwargs(self, **kwds):
         # kwds.setdefault('aw_enter', self.is_awaitable)
+        if _is_async_cm_factory(concrete := self.concrete):
+            # async context managers are created synchronously but entered
+            # asynchronously. See `nodes.Resource`.
+            kwds.setdefault("concrete", _async_call(concrete))
         return super()._node_kwargs(**kwds)
 
 
+def _is_async_cm_factory(func) -> bool:
+    if isinstance(func, type):
+        return hasattr(func, "__aenter__") and hasattr(func, "__aexit__")
+    return isasyncgenfunction(getattr(func, "__wrapped__", None))
+
+
+def _async_call(func):
+    async def call(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return call
+
+
+@attr.s(slots=True, cmp=True, frozen=True)
+class Template(Provider[abc.Callable[..., Provider], nodes._T_Node]):
+    """A `Template` provides parameterizations of a generic dependency. e.g.
+    `Repo[User]` and `Repo[Post]` for a template registered for `Repo`.
+
+    The given `concrete` is called with the type arguments of each
+    parameterization and should return the `Provider` to use for it. Any other
+    return value is used as the factory of a `Factory` provider.
+
+        def repo(model):
+            return Factory(SqlRepo, model)
+
+        container.template(Repo, repo)
+
+    Providers are created once per parameterization and shared by all graphs.
+    The returned providers are bound to the template's container so they must
+    not belong to another container. Their `filters` (see `Provider.when()`)
+    are applied as usual.
+
+    Params:
+        concrete (Callable[..., Union[Provider, Callable]]): the template
+            function.
+    """
+
+    is_template: t.ClassVar[bool] = True
+
+    _v_providers: dict[tuple, Provider] = attr.ib(
+        init=False, factory=dict, cmp=False, repr=False
+    )
+
+    def get_provider(self, *args: t.Any) -> Provider:
+        """Returns the provider for the given type arguments.
+
+        Args:
+            *args (Any): the type arguments. e.g. `User` for `Repo[User]`.
+
+        Returns:
+            provider (Provider): the provider
+        """
+        try:
+            return self._v_providers[args]
+        except KeyError:
+            pro = self.concrete(*args)
+            if not isinstance(pro, Provider):
+                pro = Factory(pro)
+            pro._setup(self.container)
+            pro._freeze()
+            return self._v_providers.setdefault(args, pro)
+
+    def _resolve(self, abstract: T_Injectable, scope: "Graph"):
+        if args := t.get_args(abstract):
+            pro = self.get_provider(*args)
+            if pro._can_resolve(scope.make_key(abstract), scope):
+                return pro._resolve(abstract, scope)
+
+    def _make_node(self, abstract: T_Injectable, scope: "Graph", **kwds):
+        pro = self.get_provider(*t.get_args(abstract))
+        return pro._make_node(abstract, scope, **kwds)
+
+
 @attr.s(slots=True, init=False)
 class Partial(Factory[T_Injected, nodes._T_PartialNode]):
     """A `Factory` provider that accepts extra arguments during resolution.
@@ -688,11 +894,28 @@ class Callable(Partial[T_Injected, nodes._T_CallableNode]):
 
 @attr.s(slots=True, frozen=True)
 class LookupMarkerProvider(Factory[lookups.look, nodes._T_FactoryNode]):
-    """Provider for resolving `uzi.Lookup` dependencies."""
+    """Provider for resolving `uzi.Lookup` dependencies.
+
+    Lookups on `Value` or `Singleton` dependencies always evaluate to the same
+    result. Such lookups are folded into a singleton that is evaluated once
+    per injector on first access.
+    """
 
     abstract = Lookup
     concrete = attr.ib(init=False, default=lookups.look)
 
+    _foldable_node_types: t.ClassVar = nodes.Value, nodes.Singleton
+    _folded_node_type: t.ClassVar = nodes.Singleton
+    _await_params_folded_node_type: t.ClassVar = nodes.AwaitParamsSingleton
+
+    def _get_node_type(self, params: BoundParams) -> type[_T_Node]:
+        foldable, deps = self._foldable_node_types, params.dependencies
+        if deps and all(isinstance(d, foldable) for d in deps):
+            if params.is_async:
+                return self._await_params_folded_node_type
+            return self._folded_node_type
+        return super()._get_node_type(params)
+
     def _bind_params(self, scope: "Graph", marker: Lookup, *, sig=None, arguments=()):
         if not arguments:
             abstract = marker.__abstract__
@@ -755,6 +978,100 @@ class DepMarkerProvider(Provider[_T_Concrete]):
             return self._make_node(marker, scope, concrete=marker.default)
 
 
+@attr.s(slots=True, frozen=True)
+class ResolvedMarkerProvider(Provider[_T_Concrete]):
+    """Provider for resolving `uzi.markers.Resolved` dependencies."""
+
+    abstract = Resolved
+    concrete = attr.ib(init=False, default=Resolved)
+    _node_type = nodes.Resolved
+
+    def _resolve(self, marker: Resolved, scope: "Graph") -> nodes.Node:
+        if node := scope[marker.abstract]:
+            if not node.is_async:
+                return node
+            elif not isinstance(node, nodes.Singleton):
+                raise TypeError(
+                    f"`{marker}` requires an async singleton. `{node.abstract}` "
+                    f"creates a new value on every call so it's never resolved."
+                )
+            return self._make_node(marker, scope, concrete=node)
+
+
+@attr.s(slots=True, frozen=True)
+class LazyMarkerProvider(Provider[_T_Concrete]):
+    """Provider for resolving `uzi.markers.Lazy` dependencies."""
+
+    abstract = Lazy
+    concrete = attr.ib(init=False, default=Lazy)
+    _node_type = nodes.Lazy
+
+    def _resolve(self, marker: Lazy, scope: "Graph") -> nodes.Node:
+        if node := scope[marker.abstract]:
+            return self._make_node(marker, scope, concrete=node)
+
+
+@attr.s(slots=True, frozen=True)
+class ProviderOfMarkerProvider(Provider[_T_Concrete]):
+    """Provider for resolving `uzi.markers.ProviderOf` dependencies."""
+
+    abstract = ProviderOf
+    concrete = attr.ib(init=False, default=ProviderOf)
+    _node_type = nodes.ProviderOf
+
+    def _resolve(self, marker: ProviderOf, scope: "Graph") -> nodes.Node:
+        if node := scope[marker.abstract]:
+            return self._make_node(marker, scope, concrete=node)
+
+
+@attr.s(slots=True, frozen=True)
+class AllMarkerProvider(Provider[_T_Concrete]):
+    """Provider for resolving `uzi.markers.All` dependencies."""
+
+    abstract = All
+    concrete = attr.ib(init=False, default=All)
+    _node_type = nodes.All
+
+    def _resolve(self, marker: All, scope: "Graph") -> nodes.Node:
+        abstract, items = marker.abstract, []
+        for prov in scope.find_providers(scope.make_key(abstract)):
+            with scope.stack.push(prov, abstract):
+                if node := prov._resolve(abstract, scope):
+                    items.append(scope.hoist(node))
+
+        if isinstance(base := scope.parent[marker], nodes.All):
+            items.extend(base.items)
+        return self._make_node(marker, scope, items=items)
+
+
+@attr.s(slots=True, frozen=True)
+class KeyedMarkerProvider(Provider[_T_Concrete]):
+    """Provider for resolving `uzi.markers.Keyed` mappings. i.e. `Keyed[T]`."""
+
+    abstract = Keyed
+    concrete = attr.ib(init=False, default=Keyed)
+    _node_type = nodes.Keyed
+
+    def _resolve(self, marker: Keyed, scope: "Graph") -> nodes.Node:
+        if not marker.key is Missing:
+            return
+
+        abstract, items = marker.abstract, {}
+        if isinstance(base := scope.parent[marker], nodes.Keyed):
+            items.update(base.items)
+
+        keys = dict.fromkeys(
+            k.key
+            for c in scope.pros[scope.make_key(marker).src]
+            for k in c.providers
+            if k.__class__ is Keyed and k.abstract == abstract
+        )
+        for key in keys:
+            if node := scope[Keyed(abstract, key)]:
+                items[key] = node
+        return self._make_node(marker, scope, items=items)
+
+
 _T_Fn = t.TypeVar("_T_Fn", bound=abc.Callable)
 
 
@@ -833,9 +1150,21 @@ class ProviderRegistryMixin(ABC):
         ) -> Singleton:
             ...  # pragma: no cover
 
+        def resolution_scoped(
+            self, abstract: Injectable, factory: _T_Fn = ..., *a, **kw
+        ) -> ResolutionScoped:
+            ...  # pragma: no cover
+
+        def template(
+            self, abstract: Injectable, template: _T_Fn = ..., *a, **kw
+        ) -> Template:
+            ...  # pragma: no cover
+
     alias = _provder_factory_method(Alias)
     value = _provder_factory_method(Value)
     callable = _provder_factory_method(Callable)
     factory = _provder_factory_method(Factory)
     resource = _provder_factory_method(Resource)
     singleton = _provder_factory_method(Singleton)
+    resolution_scoped = _provder_factory_method(ResolutionScoped)
+    template = _provder_factory_method(Template)
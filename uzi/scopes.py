@@ -1,17 +1,22 @@
-from contextvars import ContextVar
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import Context, ContextVar, copy_context
 from logging import getLogger
-from threading import Lock, local
+from threading import Barrier, BrokenBarrierError, Lock, local
 import typing as t
 
 from typing_extensions import Self
 
 
 from ._common import private_setattr
+from .markers import Injectable
 
 from .exceptions import InvalidStateError, InvalidStateError
 from .containers import BaseContainer, Container
+from .graph import nodes
 from .graph.core import Graph, _null_graph
-from .injectors import Injector, NullInjector, _null_injector
+from .graph.nodes import Node
+from .injectors import AsyncInjector, Injector, NullInjector, _null_injector
 
 logger = getLogger(__name__)
 
@@ -133,8 +138,10 @@ class Scope(t.Generic[_T_Injector]):
 
     def _pop(self, *, force: bool = False):
         if force or self.active:
-            self.current.close()
-            self._set_current(self.initial)
+            try:
+                self.current.close()
+            finally:
+                self._set_current(self.initial)
 
     def _set_current(self, injector: _T_Injector):
         self.__setattr("current", injector, injector is self.initial)
@@ -166,30 +173,92 @@ class Scope(t.Generic[_T_Injector]):
         return err and err[0] != None or False
 
 
+class _PendingInjector:
+    """Published by `ThreadSafeScope` while it's injector is being created."""
+
+    __slots__ = ("injector", "_lock")
+
+    def __init__(self) -> None:
+        self.injector = None
+        self._lock = Lock()
+        self._lock.acquire()
+
+    def set(self, injector: t.Optional[Injector]):
+        self.injector = injector
+        self._lock.release()
+
+    def wait(self):
+        with self._lock:
+            return self.injector
+
+
 class ThreadSafeScope(Scope[_T_Injector]):
-    """A thread safe `Scope` implementation"""
+    """A thread safe `Scope` implementation.
+
+    The current injector is published in a dict using atomic `setdefault()`,
+    `get()` and `pop()` calls instead of a lock. Pushing threads claim a
+    separate key of the dict while creating the injector so that `pop()` only
+    ever removes published injectors. A thread only waits when another thread
+    is creating the injector it requested.
+    """
 
-    __slots__ = ("lock",)
+    __slots__ = ("__slot",)
 
-    lock: Lock
+    __slot: dict[int, t.Union[_T_Injector, _PendingInjector]]
 
     def __init_attrs__(self, kwds: dict):
-        kwds["lock"] = Lock()
+        self.__slot = {}
         return super().__init_attrs__(kwds)
 
-    def push(self) -> _T_Injector:
-        if self.active:
-            raise InvalidStateError(f"injector already running: {self}")
+    @property
+    def current(self):
+        return self.__slot.get(_CURRENT, self.initial)
 
-        with self.lock:
+    def injector(self, *, push=True) -> _T_Injector:
+        if inj := self.current:
+            return inj
+        elif push:
             return self._push()
+        else:
+            return self._new_injector()
+
+    def push(self) -> _T_Injector:
+        return self._push(force=True)
+
+    def _push(self, *, force: bool = False):
+        slot, pending = self.__slot, _PendingInjector()
+        if not (claim := slot.setdefault(_CLAIM, pending)) is pending:
+            if force:
+                raise InvalidStateError(f"injector already running: {self}")
+            elif inj := slot.get(_CURRENT):
+                return inj
+            return claim.wait() or self._push()
+
+        inj = None
+        try:
+            if inj := slot.get(_CURRENT):
+                if force:
+                    raise InvalidStateError(f"injector already running: {self}")
+                return inj
+            inj = slot[_CURRENT] = self._new_injector()
+        finally:
+            del slot[_CLAIM]
+            pending.set(inj)
+        return inj
 
     def pop(self):
-        if self.active:
-            with self.lock:
-                return self._pop()
+        if (inj := self.__slot.pop(_CURRENT, None)) is None:
+            raise InvalidStateError(f"injector not running: {self}")
+        inj.close()
+
+    def _set_current(self, injector: _T_Injector):
+        if injector is self.initial:
+            self.__slot.pop(_CURRENT, None)
+        else:
+            self.__slot[_CURRENT] = injector
+
 
-        raise InvalidStateError(f"injector not running: {self}")
+_CURRENT, _CLAIM = 0, 1
 
 
 class _ThreadLocalState(local, t.Generic[_T_Injector]):
@@ -203,11 +272,17 @@ class _ThreadLocalState(local, t.Generic[_T_Injector]):
 
 
 class ThreadLocalScope(Scope[_T_Injector]):
-    """A scope that uses `threading.local` to manage injectors"""
+    """A scope that uses `threading.local` to manage injectors.
+
+    Each thread gets it's own injector. Use `make_template()` to bind the
+    dependencies that can be shared between threads once and `prewarm()` to
+    create the injectors of an executor's threads ahead of time.
+    """
 
-    __slots__ = ("__local",)
+    __slots__ = ("__local", "__template")
 
     __local: _ThreadLocalState[_T_Injector]
+    __template: dict[Node, t.Callable]
 
     @property
     def current(self):
@@ -215,12 +290,102 @@ class ThreadLocalScope(Scope[_T_Injector]):
 
     def __init_attrs__(self, kwds):
         self.__local = _ThreadLocalState(kwds["initial"])
+        self.__template = {}
         return super().__init_attrs__(kwds)
 
+    def _new_injector(self):
+        return self._injector_class(
+            self.graph, self.parent.injector(), self.__template
+        )
+
     def _set_current(self, injector: _T_Injector) -> _T_Injector:
         self.__local.injector = injector
         return injector
 
+    def make_template(self, *abstracts: Injectable) -> dict[Node, t.Callable]:
+        """Bind the given dependencies once for all threads.
+
+        Injectors created afterwards start with the bound callables that are
+        safe to share between threads. i.e. those of factories and values of
+        this scope that don't (indirectly) depend on a singleton or on another
+        scope. The rest (e.g. singletons) are bound afresh in each thread.
+
+        Returns:
+            template (dict): the shared bound callables keyed by their nodes.
+        """
+        graph, memo = self.graph, {}
+        inj = self._injector_class(graph, self.parent.injector(), self.__template)
+        for abstract in abstracts:
+            inj.bound(abstract)
+
+        template = {
+            node: func
+            for node, func in inj.items()
+            if _is_thread_safe_node(node, graph, memo)
+        }
+        self.__template = template
+        return template
+
+    def prewarm(
+        self,
+        executor: ThreadPoolExecutor,
+        *abstracts: Injectable,
+        workers: int,
+        timeout: float = 10.0,
+    ):
+        """Create an injector in each thread of the given executor and bind
+        the given dependencies in it.
+
+        Waits for `workers` threads to start so the executor must not be busy
+        and `workers` must not exceed it's `max_workers`.
+
+        Args:
+            executor (ThreadPoolExecutor): the executor.
+            *abstracts (Injectable): the dependencies to bind.
+            workers (int): the number of the executor's threads to prewarm.
+            timeout (float, optional): seconds to wait for the threads to start.
+                Defaults to 10.
+
+        Raises:
+            TimeoutError: if `workers` threads didn't start within `timeout`.
+
+        Returns:
+            injectors (tuple[Injector]): an injector for each thread.
+        """
+        barrier = Barrier(workers, timeout=timeout)
+
+        def warm():
+            barrier.wait()
+            inj = self.injector()
+            for abstract in abstracts:
+                inj.bound(abstract)
+            return inj
+
+        futs = [executor.submit(warm) for _ in range(workers)]
+        try:
+            return tuple(fut.result() for fut in futs)
+        except BrokenBarrierError as e:
+            raise TimeoutError(
+                f"prewarm() timed out after {timeout}s waiting for {workers} "
+                "threads. Make sure the executor is idle and `workers` doesn't "
+                "exceed it's `max_workers`."
+            ) from e
+
+
+def _is_thread_safe_node(node: Node, graph: Graph, memo: dict[Node, bool]):
+    if (rv := memo.get(node)) is None:
+        memo[node] = False
+        if isinstance(node, nodes.Value):
+            rv = True
+        elif node.graph is graph and isinstance(node, nodes.Factory):
+            rv = not isinstance(node, nodes.Singleton) and all(
+                _is_thread_safe_node(d, graph, memo) for d in node.dependencies
+            )
+        else:
+            rv = False
+        memo[node] = rv
+    return rv
+
 
 class _NullContextVar:
     __slots__ = ()
@@ -232,6 +397,53 @@ class _NullContextVar:
 _null_context_var = _NullContextVar()
 
 
+class ContextBinding(t.Generic[_T_Injector]):
+    """A handle to the injector of a `ContextLocalScope` in the current context.
+
+    The injector is looked up (or pushed) once when the handle is created and
+    cached on the handle. Closing the handle pops the injector if it was pushed
+    by the handle. See `ContextLocalScope.bind_context()`.
+
+    Attributes:
+        scope (ContextLocalScope): the scope.
+        injector (Injector): the injector.
+    """
+
+    __slots__ = ("scope", "injector", "_token")
+
+    scope: "ContextLocalScope[_T_Injector]"
+    injector: _T_Injector
+
+    def __init__(self, scope: "ContextLocalScope[_T_Injector]", injector, token=None):
+        self.scope = scope
+        self.injector = injector
+        self._token = token
+
+    def bound(self, abstract: Injectable):
+        return self.injector.bound(abstract)
+
+    def make(self, abstract: Injectable, /, *args, **kwds):
+        return self.injector.make(abstract, *args, **kwds)
+
+    def close(self):
+        if token := self._token:
+            self._token = None
+            self.scope._reset(token)
+            self.injector.close()
+
+    async def aclose(self):
+        if token := self._token:
+            self._token = None
+            self.scope._reset(token)
+            await self.injector.aclose()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *err):
+        self.close()
+
+
 class ContextLocalScope(Scope[_T_Injector]):
     """A scope that uses `contextvars.ContextVar` to manage injectors"""
 
@@ -251,6 +463,172 @@ class ContextLocalScope(Scope[_T_Injector]):
     def _set_current(self, injector: _T_Injector) -> _T_Injector:
         self.__var.set(injector)
 
+    def _reset(self, token):
+        self.__var.reset(token)
+
+    def bind_context(self) -> ContextBinding[_T_Injector]:
+        """Returns a handle to the injector of the current context, pushing a
+        new one if none is running.
+
+        Use the handle instead of the scope in hot paths to avoid looking up
+        the current injector on every access. If the handle pushed the injector
+        closing it (or exiting it's context) pops the injector.
+        """
+        if inj := self.__var.get():
+            return ContextBinding(self, inj)
+        inj = self._new_injector()
+        return ContextBinding(self, inj, self.__var.set(inj))
+
+    def task_factory(self, factory: t.Callable = None):
+        """Returns an `asyncio` task factory that runs each new task with it's
+        own injector unless one is already running in the context it inherits.
+
+        The injector is created once when the task is created and closed when
+        the task is done.
+
+        Usage:
+            loop.set_task_factory(scope.task_factory(loop.get_task_factory()))
+
+        Args:
+            factory (Callable, optional): the task factory to wrap. Defaults to
+                creating `asyncio.Task` objects.
+        """
+        var = self.__var
+        factory = factory or asyncio.Task
+
+        def task_factory(loop, coro, **kwds):
+            context: Context = kwds.get("context") or copy_context()
+            if inj := None if context.get(var) else self._new_injector():
+                # Don't change the given context. It may be used elsewhere.
+                if "context" in kwds:
+                    context = kwds["context"] = context.copy()
+                context.run(var.set, inj)
+            # Tasks copy the context they are created in unless one is given.
+            if factory is asyncio.Task:
+                task = context.run(factory, coro, loop=loop, **kwds)
+            else:
+                task = context.run(factory, loop, coro, **kwds)
+            inj and task.add_done_callback(lambda _: inj.close())
+            return task
+
+        return task_factory
+
+
+class AsyncScope(ContextLocalScope[AsyncInjector]):
+    """A `ContextLocalScope` with async teardown.
+
+    Use it as an async context manager (`async with scope:`) to push an
+    injector and await it's teardown on exit. See `AsyncInjector.on_close()`.
+    Tasks get their own injector unless one is running in the context they
+    inherit. Use `task_group()` to run tasks with the current injector.
+    """
+
+    __slots__ = ()
+
+    _injector_class = AsyncInjector
+
+    async def apop(self):
+        """Pop the current injector and await it's teardown."""
+        if not self.active:
+            raise InvalidStateError(f"injector not running: {self}")
+        return await self._apop(force=True)
+
+    async def _apop(self, *, force: bool = False):
+        if force or self.active:
+            await self.current.aclose()
+            self._set_current(self.initial)
+
+    def task_group(self) -> "asyncio.TaskGroup":
+        """Returns an `asyncio.TaskGroup` whose tasks share the injector of the
+        current context.
+
+        Each task runs in a copy of the `Context` the group was entered in. The
+        copy holds the same injector so the injector is still shared. Copying a
+        `Context` is cheap (it's an immutable mapping) and unlike sharing one
+        context, keeps `ContextVar` changes made by a task from leaking into
+        it's siblings. An injector is pushed if none is running and popped after
+        all tasks are done. On Python < 3.11, a minimal task group is used instead. It cancels
+        the remaining tasks when one fails and re-raises the first error.
+        """
+        return _ScopeTaskGroup(self)
+
+    async def __aenter__(self):
+        return self.injector()
+
+    async def __aexit__(self, *err):
+        await self.apop()
+
+
+def _failed(task: asyncio.Task):
+    return task.done() and not task.cancelled() and not task.exception() is None
+
+
+class _CompatScopeTaskGroup:
+    """The `AsyncScope.task_group()` of Python < 3.11."""
+
+    __slots__ = ("_scope", "_binding", "_context", "_tasks")
+
+    def __init__(self, scope: AsyncScope) -> None:
+        self._scope = scope
+        self._binding = self._context = None
+        self._tasks: list[asyncio.Task] = []
+
+    async def __aenter__(self):
+        self._binding = self._scope.bind_context()
+        self._context = copy_context()
+        return self
+
+    async def __aexit__(self, etype, exc, tb):
+        tasks = self._tasks
+        try:
+            if not etype is None:
+                for task in tasks:
+                    task.cancel()
+            while pending := [task for task in tasks if not task.done()]:
+                await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+                if any(_failed(task) for task in tasks):
+                    for task in tasks:
+                        task.cancel()
+            errors = [task.exception() for task in tasks if _failed(task)]
+            if etype is None and errors:
+                raise errors[0]
+        finally:
+            await self._binding.aclose()
+
+    def create_task(self, coro, *, name=None, context=None):
+        context = context or self._context.copy()
+        task = context.run(asyncio.get_running_loop().create_task, coro, name=name)
+        self._tasks.append(task)
+        return task
+
+
+if hasattr(asyncio, "TaskGroup"):
+
+    class _ScopeTaskGroup(asyncio.TaskGroup):
+        def __init__(self, scope: AsyncScope) -> None:
+            super().__init__()
+            self._scope = scope
+            self._binding = self._context = None
+
+        async def __aenter__(self):
+            self._binding = self._scope.bind_context()
+            self._context = copy_context()
+            return await super().__aenter__()
+
+        async def __aexit__(self, *err):
+            try:
+                return await super().__aexit__(*err)
+            finally:
+                await self._binding.aclose()
+
+        def create_task(self, coro, *, name=None, context=None):
+            return super().create_task(
+                coro, name=name, context=context or self._context.copy()
+            )
+
+else:  # pragma: no cover
+    _ScopeTaskGroup = _CompatScopeTaskGroup
+
 
 class NullScope(Scope[NullInjector]):
     """A 'noop' `Scope` used as the parent of root scopes.